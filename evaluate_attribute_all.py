@@ -1,8 +1,17 @@
 import json
 import argparse
+import os
+import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 import numpy as np
+import torch
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
 from evaluate_attribute import (
     CLIPSimilarityEvaluator, 
     load_ground_truth, 
@@ -13,22 +22,24 @@ from evaluate_attribute import (
 )
 
 
+# Captures both ScanNet (scene0001_00) and 3RScan (uuid) scene IDs ahead of
+# the trailing timestamp in one C-level match
+_SCENE_ID_RE = re.compile(r'^annotations_(scene\d+_\d+|[0-9a-f-]+)_\d+$')
+
+
 def extract_scene_id(validation_filename):
     """Extract scene ID from validation filename.
-    
+
     Examples:
         annotations_02b33dfb-be2b-2d54-92d2-cd012b2b3c40_1769641580995.json -> 02b33dfb-be2b-2d54-92d2-cd012b2b3c40
         annotations_scene0001_00_1769639833162.json -> scene0001_00
     """
     stem = Path(validation_filename).stem
-    # Remove 'annotations_' prefix and timestamp suffix
-    parts = stem.split('_')
-    if stem.startswith('annotations_scene'):
-        # ScanNet: annotations_scene0001_00_timestamp
-        return f"{parts[1]}_{parts[2]}"
-    else:
-        # 3RScan: annotations_uuid_timestamp
-        return parts[1]
+    match = _SCENE_ID_RE.match(stem)
+    if match:
+        return match.group(1)
+    # Fallback for unexpected names: strip prefix and timestamp suffix
+    return stem.split('_', 1)[1].rsplit('_', 1)[0]
 
 
 def find_validation_and_scene_graph_pairs(base_dir):
@@ -43,33 +54,139 @@ def find_validation_and_scene_graph_pairs(base_dir):
         if not validation_dir.exists():
             print(f"Warning: {validation_dir} does not exist")
             continue
-        
+
+        # One directory read per dataset instead of a stat() per validation
+        # file; scene presence becomes a set-membership test
+        scene_ids_present = set()
+        if scene_graph_dir.exists():
+            scene_ids_present = {e.name for e in os.scandir(scene_graph_dir) if e.is_dir()}
+
         for validation_file in sorted(validation_dir.glob('annotations_*.json')):
             scene_id = extract_scene_id(validation_file.name)
-            scene_graph_file = scene_graph_dir / scene_id / 'scene_graph.json'
-            
-            if scene_graph_file.exists():
-                pairs[dataset].append({
-                    'scene_id': scene_id,
-                    'validation_file': str(validation_file),
-                    'scene_graph_file': str(scene_graph_file),
-                    'dataset': dataset
-                })
-            else:
-                print(f"Warning: Scene graph not found for {scene_id}: {scene_graph_file}")
+
+            # The set test filters out missing scenes for free; one stat on
+            # the inner scene_graph.json remains for the scenes that matched
+            if scene_id in scene_ids_present:
+                scene_graph_file = scene_graph_dir / scene_id / 'scene_graph.json'
+                if scene_graph_file.exists():
+                    pairs[dataset].append({
+                        'scene_id': scene_id,
+                        'validation_file': str(validation_file),
+                        'scene_graph_file': str(scene_graph_file),
+                        'dataset': dataset
+                    })
+                    continue
+            print(f"Warning: Scene graph not found for {scene_id} in {scene_graph_dir}")
     
     return pairs
 
 
-def evaluate_all_scenes(base_dir, evaluator, num_trials=10, include_images=False, max_images=3):
-    """Evaluate all scenes and return aggregated results."""
-    
+def _score_pair(pair, evaluator, num_trials, include_images, max_images):
+    """Load and score one validation/scene-graph pair."""
+    ground_truth = load_ground_truth(pair['validation_file'])
+    predictions = load_predictions(pair['scene_graph_file'])
+
+    results = calculate_similarity_scores(
+        ground_truth,
+        predictions,
+        evaluator,
+        num_random_trials=num_trials,
+        scene_id=pair['scene_id'],
+        dataset=pair['dataset'],
+        include_image_similarity=include_images,
+        max_images_per_object=max_images
+    )
+
+    # Add metadata
+    scene_result = {
+        'scene_id': pair['scene_id'],
+        'dataset': pair['dataset'],
+        'validation_file': pair['validation_file'],
+        'scene_graph_file': pair['scene_graph_file'],
+        'average_similarity': results['overall']['average_similarity'],
+        'total_objects': results['overall']['total_objects'],
+        'per_object': results['per_object']
+    }
+
+    # Add image metrics if available
+    if 'average_image_gt_similarity' in results['overall']:
+        scene_result['average_image_gt_similarity'] = results['overall']['average_image_gt_similarity']
+        scene_result['average_image_pred_similarity'] = results['overall']['average_image_pred_similarity']
+        scene_result['objects_with_images'] = results['overall']['objects_with_images']
+
+    return scene_result
+
+
+def precompute_text_embeddings(pairs_by_dataset, evaluator):
+    """Encode the union of attribute strings from every scene in one batch.
+
+    Attribute vocabularies repeat heavily across scenes, so one big warm-up
+    call fills the evaluator's text cache and the per-scene scoring then
+    mostly hits it instead of issuing many small forward passes.
+    """
+    texts = set()
+    for pairs in pairs_by_dataset.values():
+        for pair in pairs:
+            for attrs in load_ground_truth(pair['validation_file']).values():
+                texts.update(attrs)
+            for attrs in load_predictions(pair['scene_graph_file']).values():
+                texts.update(attrs)
+    if texts:
+        print(f"Precomputing embeddings for {len(texts)} unique attribute strings...")
+        evaluator.get_text_embeddings_t(sorted(texts))
+
+
+def _print_scene_line(scene_result, include_images):
+    if include_images and 'average_image_gt_similarity' in scene_result:
+        print(f"  ✓ Text Sim: {scene_result['average_similarity']:.4f}, "
+              f"Img-GT: {scene_result['average_image_gt_similarity']:.4f}, "
+              f"Img-Pred: {scene_result['average_image_pred_similarity']:.4f}, "
+              f"Objects: {scene_result['total_objects']}")
+    else:
+        print(f"  ✓ Similarity: {scene_result['average_similarity']:.4f}, Objects: {scene_result['total_objects']}")
+
+
+# Per-process state for the worker pool: the evaluator loads lazily on the
+# first scene each worker receives, so the model-load cost is paid once per
+# process instead of once per scene
+_WORKER_EVALUATOR = None
+_WORKER_CONFIG = None
+
+
+def _init_worker(evaluator_kwargs, eval_kwargs):
+    global _WORKER_CONFIG
+    _WORKER_CONFIG = (evaluator_kwargs, eval_kwargs)
+    # One BLAS thread per worker; the pool itself provides the parallelism
+    torch.set_num_threads(1)
+
+
+def _eval_one(pair):
+    """Process-pool worker: score one pair with this process's evaluator."""
+    global _WORKER_EVALUATOR
+    evaluator_kwargs, eval_kwargs = _WORKER_CONFIG
+    if _WORKER_EVALUATOR is None:
+        _WORKER_EVALUATOR = CLIPSimilarityEvaluator(**evaluator_kwargs)
+    try:
+        return _score_pair(pair, _WORKER_EVALUATOR, **eval_kwargs)
+    except Exception as e:
+        return {'scene_id': pair['scene_id'], 'dataset': pair['dataset'], 'error': str(e)}
+
+
+def evaluate_all_scenes(base_dir, evaluator=None, num_trials=0, include_images=False,
+                        max_images=3, workers=1, evaluator_kwargs=None):
+    """Evaluate all scenes and return aggregated results.
+
+    With workers > 1 the scene pairs are distributed over a process pool;
+    each worker lazily builds its own evaluator from evaluator_kwargs.
+    Otherwise the provided evaluator is used sequentially.
+    """
+
     # Find all pairs
     pairs_by_dataset = find_validation_and_scene_graph_pairs(base_dir)
-    
+
     all_results = []
     dataset_results = {'3rscan': [], 'scannet': []}
-    
+
     print("\n" + "="*80)
     print("EVALUATING ALL SCENES")
     if include_images:
@@ -77,69 +194,60 @@ def evaluate_all_scenes(base_dir, evaluator, num_trials=10, include_images=False
     else:
         print("Mode: Text-to-Text CLIP Similarity Only")
     print("="*80)
-    
+
     total_scenes = sum(len(pairs) for pairs in pairs_by_dataset.values())
+
+    if workers > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        global _WORKER_EVALUATOR
+        flat_pairs = [pair for pairs in pairs_by_dataset.values() for pair in pairs]
+        eval_kwargs = {'num_trials': num_trials, 'include_images': include_images,
+                       'max_images': max_images}
+        mp_context = None
+        if evaluator is not None and evaluator.device == 'cpu':
+            # Move the weights into shared memory and fork: every worker then
+            # maps the same in-RAM copy instead of reloading the model
+            evaluator.model.share_memory()
+            _WORKER_EVALUATOR = evaluator
+            mp_context = multiprocessing.get_context('fork')
+        print(f"\nScoring {total_scenes} scenes across {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                 initializer=_init_worker,
+                                 initargs=(evaluator_kwargs or {}, eval_kwargs)) as executor:
+            for current, (pair, scene_result) in enumerate(
+                    zip(flat_pairs, executor.map(_eval_one, flat_pairs)), 1):
+                print(f"\n[{current}/{total_scenes}] {pair['dataset']}/{pair['scene_id']}")
+                if 'error' in scene_result:
+                    print(f"  ✗ Error: {scene_result['error']}")
+                    continue
+                all_results.append(scene_result)
+                dataset_results[pair['dataset']].append(scene_result)
+                _print_scene_line(scene_result, include_images)
+        return all_results, dataset_results
+
+    precompute_text_embeddings(pairs_by_dataset, evaluator)
+
     current = 0
-    
     for dataset, pairs in pairs_by_dataset.items():
         print(f"\n{dataset.upper()}: Found {len(pairs)} scenes")
-        
+
         for pair in pairs:
             current += 1
-            scene_id = pair['scene_id']
-            print(f"\n[{current}/{total_scenes}] Evaluating {dataset}/{scene_id}...")
-            
+            print(f"\n[{current}/{total_scenes}] Evaluating {dataset}/{pair['scene_id']}...")
+
             try:
-                # Load data
-                ground_truth = load_ground_truth(pair['validation_file'])
-                predictions = load_predictions(pair['scene_graph_file'])
-                
-                # Calculate similarity
-                results = calculate_similarity_scores(
-                    ground_truth, 
-                    predictions, 
-                    evaluator, 
-                    num_random_trials=num_trials,
-                    scene_id=scene_id,
-                    dataset=dataset,
-                    include_image_similarity=include_images,
-                    max_images_per_object=max_images
-                )
-                
-                # Add metadata
-                scene_result = {
-                    'scene_id': scene_id,
-                    'dataset': dataset,
-                    'validation_file': pair['validation_file'],
-                    'scene_graph_file': pair['scene_graph_file'],
-                    'average_similarity': results['overall']['average_similarity'],
-                    'total_objects': results['overall']['total_objects'],
-                    'per_object': results['per_object']
-                }
-                
-                # Add image metrics if available
-                if 'average_image_gt_similarity' in results['overall']:
-                    scene_result['average_image_gt_similarity'] = results['overall']['average_image_gt_similarity']
-                    scene_result['average_image_pred_similarity'] = results['overall']['average_image_pred_similarity']
-                    scene_result['objects_with_images'] = results['overall']['objects_with_images']
-                
+                scene_result = _score_pair(pair, evaluator, num_trials,
+                                           include_images, max_images)
                 all_results.append(scene_result)
                 dataset_results[dataset].append(scene_result)
-                
-                if include_images and 'average_image_gt_similarity' in scene_result:
-                    print(f"  ✓ Text Sim: {scene_result['average_similarity']:.4f}, "
-                          f"Img-GT: {scene_result['average_image_gt_similarity']:.4f}, "
-                          f"Img-Pred: {scene_result['average_image_pred_similarity']:.4f}, "
-                          f"Objects: {scene_result['total_objects']}")
-                else:
-                    print(f"  ✓ Similarity: {scene_result['average_similarity']:.4f}, Objects: {scene_result['total_objects']}")
-                
+                _print_scene_line(scene_result, include_images)
             except Exception as e:
                 print(f"  ✗ Error: {e}")
                 import traceback
                 traceback.print_exc()
                 continue
-    
+
     return all_results, dataset_results
 
 
@@ -155,110 +263,122 @@ def aggregate_results(results_list):
             'max_similarity': 0.0
         }
     
-    similarities = [r['average_similarity'] for r in results_list]
-    total_objects = sum(r['total_objects'] for r in results_list)
-    
+    # One pass over the result dicts into a structured array; all statistics
+    # below are then contiguous numpy reductions instead of repeated Python
+    # list comprehensions
+    dtype = np.dtype([('sim', 'f8'), ('img_gt', 'f8'), ('img_pred', 'f8'),
+                      ('n_obj', 'i8'), ('n_wimg', 'i8'), ('n_woimg', 'i8')])
+    arr = np.fromiter(
+        ((r['average_similarity'],
+          r.get('average_image_gt_similarity', np.nan),
+          r.get('average_image_pred_similarity', np.nan),
+          r['total_objects'],
+          r.get('objects_with_images', 0),
+          r.get('objects_without_images', 0)) for r in results_list),
+        dtype=dtype, count=len(results_list))
+
+    sims = arr['sim']
     agg = {
-        'average_similarity': np.mean(similarities),
-        'std_similarity': np.std(similarities),
+        'average_similarity': sims.mean(),
+        'std_similarity': sims.std(),
         'total_scenes': len(results_list),
-        'total_objects': total_objects,
-        'min_similarity': np.min(similarities),
-        'max_similarity': np.max(similarities)
+        'total_objects': int(arr['n_obj'].sum()),
+        'min_similarity': sims.min(),
+        'max_similarity': sims.max()
     }
-    
-    # Add image metrics if available
-    img_gt_sims = [r['average_image_gt_similarity'] for r in results_list if 'average_image_gt_similarity' in r]
-    img_pred_sims = [r['average_image_pred_similarity'] for r in results_list if 'average_image_pred_similarity' in r]
-    objects_with_images = sum(r.get('objects_with_images', 0) for r in results_list)
-    objects_without_images = sum(r.get('objects_without_images', 0) for r in results_list)
-    
-    if img_gt_sims:
-        agg['average_image_gt_similarity'] = np.mean(img_gt_sims)
-        agg['std_image_gt_similarity'] = np.std(img_gt_sims)
-        agg['average_image_pred_similarity'] = np.mean(img_pred_sims)
-        agg['std_image_pred_similarity'] = np.std(img_pred_sims)
-        agg['scenes_with_images'] = len(img_gt_sims)
-        agg['total_objects_with_images'] = objects_with_images
-        agg['total_objects_without_images'] = objects_without_images
-    
+
+    # Add image metrics if available (NaN marks scenes without them)
+    has_images = ~np.isnan(arr['img_gt'])
+    if has_images.any():
+        img_gt = arr['img_gt'][has_images]
+        img_pred = arr['img_pred'][~np.isnan(arr['img_pred'])]
+        agg['average_image_gt_similarity'] = img_gt.mean()
+        agg['std_image_gt_similarity'] = img_gt.std()
+        agg['average_image_pred_similarity'] = img_pred.mean()
+        agg['std_image_pred_similarity'] = img_pred.std()
+        agg['scenes_with_images'] = int(has_images.sum())
+        agg['total_objects_with_images'] = int(arr['n_wimg'].sum())
+        agg['total_objects_without_images'] = int(arr['n_woimg'].sum())
+
     return agg
 
 
-def print_summary(all_results, dataset_results):
-    """Print comprehensive evaluation summary."""
-    
-    print("\n" + "="*80)
-    print("EVALUATION SUMMARY")
-    print("="*80)
+def print_summary(all_results, dataset_results, overall_agg, per_dataset_agg):
+    """Print comprehensive evaluation summary from precomputed aggregates."""
+
+    # Build all lines first and emit them with one write; per-line print()
+    # locks and may flush stdout on every call
+    out = []
+    out.append("\n" + "="*80)
+    out.append("EVALUATION SUMMARY")
+    out.append("="*80)
     
     # Overall results (per-scene average)
-    overall_agg = aggregate_results(all_results)
-    print(f"\n{'='*80}")
-    print(f"OVERALL (averaged across {len(all_results)} scenes)")
-    print(f"{'='*80}")
-    print(f"  Average Text-Text Similarity: {overall_agg['average_similarity']:.4f} (±{overall_agg['std_similarity']:.4f})")
+    out.append(f"\n{'='*80}")
+    out.append(f"OVERALL (averaged across {len(all_results)} scenes)")
+    out.append(f"{'='*80}")
+    out.append(f"  Average Text-Text Similarity: {overall_agg['average_similarity']:.4f} (±{overall_agg['std_similarity']:.4f})")
     
     if 'average_image_gt_similarity' in overall_agg:
-        print(f"\n  Image Statistics:")
-        print(f"    Objects with Images:    {overall_agg['total_objects_with_images']}/{overall_agg['total_objects']} "
-              f"({100*overall_agg['total_objects_with_images']/overall_agg['total_objects']:.1f}%)")
-        print(f"    Objects without Images: {overall_agg['total_objects_without_images']}/{overall_agg['total_objects']} "
-              f"({100*overall_agg['total_objects_without_images']/overall_agg['total_objects']:.1f}%)")
-        print(f"    Scenes with Images:     {overall_agg['scenes_with_images']}/{overall_agg['total_scenes']}")
+        out.append(f"\n  Image Statistics:")
+        out.append(f"    Objects with Images:    {overall_agg['total_objects_with_images']}/{overall_agg['total_objects']} "
+                   f"({100*overall_agg['total_objects_with_images']/overall_agg['total_objects']:.1f}%)")
+        out.append(f"    Objects without Images: {overall_agg['total_objects_without_images']}/{overall_agg['total_objects']} "
+                   f"({100*overall_agg['total_objects_without_images']/overall_agg['total_objects']:.1f}%)")
+        out.append(f"    Scenes with Images:     {overall_agg['scenes_with_images']}/{overall_agg['total_scenes']}")
         
-        print(f"\n  Image-to-Text Similarity:")
-        print(f"    Image-GT Similarity:    {overall_agg['average_image_gt_similarity']:.4f} (±{overall_agg['std_image_gt_similarity']:.4f})")
-        print(f"    Image-Pred Similarity:  {overall_agg['average_image_pred_similarity']:.4f} (±{overall_agg['std_image_pred_similarity']:.4f})")
+        out.append(f"\n  Image-to-Text Similarity:")
+        out.append(f"    Image-GT Similarity:    {overall_agg['average_image_gt_similarity']:.4f} (±{overall_agg['std_image_gt_similarity']:.4f})")
+        out.append(f"    Image-Pred Similarity:  {overall_agg['average_image_pred_similarity']:.4f} (±{overall_agg['std_image_pred_similarity']:.4f})")
         
         diff = overall_agg['average_image_pred_similarity'] - overall_agg['average_image_gt_similarity']
         if diff > 0.01:
-            print(f"    → Predictions better aligned with images (+{diff:.4f})")
+            out.append(f"    → Predictions better aligned with images (+{diff:.4f})")
         elif diff < -0.01:
-            print(f"    → GT better aligned with images ({diff:.4f})")
+            out.append(f"    → GT better aligned with images ({diff:.4f})")
         else:
-            print(f"    → Similar alignment (diff: {diff:+.4f})")
+            out.append(f"    → Similar alignment (diff: {diff:+.4f})")
     
-    print(f"\n  Scene Statistics:")
-    print(f"    Total Scenes:         {overall_agg['total_scenes']}")
-    print(f"    Total Objects:        {overall_agg['total_objects']}")
-    print(f"    Min Similarity:       {overall_agg['min_similarity']:.4f}")
-    print(f"    Max Similarity:       {overall_agg['max_similarity']:.4f}")
+    out.append(f"\n  Scene Statistics:")
+    out.append(f"    Total Scenes:         {overall_agg['total_scenes']}")
+    out.append(f"    Total Objects:        {overall_agg['total_objects']}")
+    out.append(f"    Min Similarity:       {overall_agg['min_similarity']:.4f}")
+    out.append(f"    Max Similarity:       {overall_agg['max_similarity']:.4f}")
     
     # Per-dataset results
     for dataset in ['3rscan', 'scannet']:
         if dataset_results[dataset]:
-            agg = aggregate_results(dataset_results[dataset])
-            print(f"\n{'-'*80}")
-            print(f"{dataset.upper()} (averaged across {len(dataset_results[dataset])} scenes)")
-            print(f"{'-'*80}")
-            print(f"  Average Text-Text Similarity: {agg['average_similarity']:.4f} (±{agg['std_similarity']:.4f})")
+            agg = per_dataset_agg[dataset]
+            out.append(f"\n{'-'*80}")
+            out.append(f"{dataset.upper()} (averaged across {len(dataset_results[dataset])} scenes)")
+            out.append(f"{'-'*80}")
+            out.append(f"  Average Text-Text Similarity: {agg['average_similarity']:.4f} (±{agg['std_similarity']:.4f})")
             
             if 'total_objects_with_images' in agg:
-                print(f"  Objects with Images:  {agg['total_objects_with_images']}/{agg['total_objects']} "
-                      f"({100*agg['total_objects_with_images']/agg['total_objects']:.1f}%)")
+                out.append(f"  Objects with Images:  {agg['total_objects_with_images']}/{agg['total_objects']} "
+                           f"({100*agg['total_objects_with_images']/agg['total_objects']:.1f}%)")
             
             if 'average_image_gt_similarity' in agg:
-                print(f"  Image-GT Similarity:  {agg['average_image_gt_similarity']:.4f} (±{agg['std_image_gt_similarity']:.4f})")
-                print(f"  Image-Pred Similarity:{agg['average_image_pred_similarity']:.4f} (±{agg['std_image_pred_similarity']:.4f})")
+                out.append(f"  Image-GT Similarity:  {agg['average_image_gt_similarity']:.4f} (±{agg['std_image_gt_similarity']:.4f})")
+                out.append(f"  Image-Pred Similarity:{agg['average_image_pred_similarity']:.4f} (±{agg['std_image_pred_similarity']:.4f})")
             
-            print(f"  Total Scenes:         {agg['total_scenes']}")
-            print(f"  Total Objects:        {agg['total_objects']}")
-            print(f"  Min Similarity:       {agg['min_similarity']:.4f}")
-            print(f"  Max Similarity:       {agg['max_similarity']:.4f}")
+            out.append(f"  Total Scenes:         {agg['total_scenes']}")
+            out.append(f"  Total Objects:        {agg['total_objects']}")
+            out.append(f"  Min Similarity:       {agg['min_similarity']:.4f}")
+            out.append(f"  Max Similarity:       {agg['max_similarity']:.4f}")
     
     # Per-scene results
-    print(f"\n{'='*80}")
-    print("PER-SCENE RESULTS")
-    print(f"{'='*80}")
+    out.append(f"\n{'='*80}")
+    out.append("PER-SCENE RESULTS")
+    out.append(f"{'='*80}")
     
     has_images = any('average_image_gt_similarity' in r for r in all_results)
     
     if has_images:
-        print(f"{'Dataset':<10} {'Scene ID':<40} {'Text-Text':<12} {'Img-GT':<10} {'Img-Pred':<10} {'Objs':<8}")
+        out.append(f"{'Dataset':<10} {'Scene ID':<40} {'Text-Text':<12} {'Img-GT':<10} {'Img-Pred':<10} {'Objs':<8}")
     else:
-        print(f"{'Dataset':<10} {'Scene ID':<40} {'Similarity':<12} {'Objects':<8}")
-    print(f"{'-'*80}")
+        out.append(f"{'Dataset':<10} {'Scene ID':<40} {'Similarity':<12} {'Objects':<8}")
+    out.append(f"{'-'*80}")
     
     # Sort by similarity (worst first for debugging)
     sorted_results = sorted(all_results, key=lambda x: x['average_similarity'])
@@ -272,30 +392,61 @@ def print_summary(all_results, dataset_results):
         if has_images and 'average_image_gt_similarity' in result:
             img_gt = result['average_image_gt_similarity']
             img_pred = result['average_image_pred_similarity']
-            print(f"{dataset:<10} {scene_id:<40} {sim:.4f}       {img_gt:.4f}    {img_pred:.4f}    {obj_count:<8}")
+            out.append(f"{dataset:<10} {scene_id:<40} {sim:.4f}       {img_gt:.4f}    {img_pred:.4f}    {obj_count:<8}")
         elif has_images:
-            print(f"{dataset:<10} {scene_id:<40} {sim:.4f}       {'N/A':<10} {'N/A':<10} {obj_count:<8}")
+            out.append(f"{dataset:<10} {scene_id:<40} {sim:.4f}       {'N/A':<10} {'N/A':<10} {obj_count:<8}")
         else:
-            print(f"{dataset:<10} {scene_id:<40} {sim:.4f}       {obj_count:<8}")
+            out.append(f"{dataset:<10} {scene_id:<40} {sim:.4f}       {obj_count:<8}")
 
+    sys.stdout.write('\n'.join(out) + '\n')
+
+
+def save_detailed_results(all_results, overall_agg, per_dataset_agg, output_file,
+                          parquet=False, pretty=False):
+    """Save detailed results to JSON file.
+
+    With parquet=True (and pyarrow installed) the bulky per-scene records go
+    to a columnar .parquet sibling instead, and the JSON keeps only the
+    overall/by-dataset summary; re-reading per-scene data for analysis then
+    avoids re-parsing a huge JSON blob.
+    """
 
-def save_detailed_results(all_results, dataset_results, output_file):
-    """Save detailed results to JSON file."""
-    
     output = {
-        'overall': aggregate_results(all_results),
-        'by_dataset': {
-            '3rscan': aggregate_results(dataset_results['3rscan']),
-            'scannet': aggregate_results(dataset_results['scannet'])
-        },
+        'overall': overall_agg,
+        'by_dataset': per_dataset_agg,
         'per_scene': all_results
     }
-    
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
-    
+
+    parquet_file = None
+    if parquet:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("Warning: pyarrow not installed, keeping per-scene results in JSON")
+        else:
+            parquet_file = str(Path(output_file).with_suffix('.parquet'))
+            pq.write_table(pa.Table.from_pylist(all_results), parquet_file,
+                           compression='snappy')
+            output.pop('per_scene')
+
+    # Compact output by default: indentation roughly doubles the file size
+    # and downstream parse time for no benefit to tooling
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output, option=option))
+    else:
+        with open(output_file, 'w') as f:
+            if pretty:
+                json.dump(output, f, indent=2)
+            else:
+                json.dump(output, f, separators=(',', ':'))
+
     print(f"\n{'='*80}")
     print(f"Detailed results saved to: {output_file}")
+    if parquet_file:
+        print(f"Per-scene results saved to: {parquet_file}")
     print(f"{'='*80}")
 
 
@@ -315,11 +466,22 @@ def main():
         default='attribute_evaluation_all_scenes.json',
         help='Output JSON file for detailed results'
     )
+    parser.add_argument(
+        '--parquet',
+        action='store_true',
+        help='Write per-scene results to a columnar .parquet sibling (requires pyarrow)'
+    )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent the output JSON (larger files, easier to eyeball)'
+    )
     parser.add_argument(
         '--num-trials',
         type=int,
-        default=10,
-        help='Number of random orderings to average (default: 10)'
+        default=0,
+        help='Number of random orderings to average; 0 (default) uses '
+             'order-invariant per-attribute scoring'
     )
     parser.add_argument(
         '--model',
@@ -344,27 +506,57 @@ def main():
         default=3,
         help='Maximum images to load per object (default: 3)'
     )
-    
+    parser.add_argument(
+        '--embedding-cache',
+        type=str,
+        default=None,
+        help='Directory for persistent text/image embedding caches; re-runs '
+             'skip CLIP forward passes for unchanged inputs'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for scene evaluation; each loads its own '
+             'model, so values > 1 are mainly useful on CPU (default: 1)'
+    )
+
     args = parser.parse_args()
-    
-    # Initialize CLIP evaluator
-    print("Loading CLIP model...")
-    evaluator = CLIPSimilarityEvaluator(model_name=args.model, device=args.device)
-    
+
+    evaluator = None
+    evaluator_kwargs = {'model_name': args.model, 'device': args.device,
+                        'cache_dir': args.embedding_cache}
+    if args.workers <= 1:
+        # Initialize CLIP evaluator
+        print("Loading CLIP model...")
+        evaluator = CLIPSimilarityEvaluator(**evaluator_kwargs)
+    elif args.device == 'cpu' or (args.device is None and not torch.cuda.is_available()
+                                  and not torch.backends.mps.is_available()):
+        # CPU pools fork off one shared copy of the weights, so load up front
+        print("Loading CLIP model (shared across workers)...")
+        evaluator = CLIPSimilarityEvaluator(**evaluator_kwargs)
+
     # Evaluate all scenes
     all_results, dataset_results = evaluate_all_scenes(
-        args.base_dir, 
-        evaluator, 
+        args.base_dir,
+        evaluator,
         num_trials=args.num_trials,
         include_images=args.include_images,
-        max_images=args.max_images
+        max_images=args.max_images,
+        workers=args.workers,
+        evaluator_kwargs=evaluator_kwargs
     )
     
+    # Aggregate once and reuse for both the summary and the saved report
+    overall_agg = aggregate_results(all_results)
+    per_dataset_agg = {d: aggregate_results(dataset_results[d]) for d in ('3rscan', 'scannet')}
+
     # Print summary
-    print_summary(all_results, dataset_results)
+    print_summary(all_results, dataset_results, overall_agg, per_dataset_agg)
     
     # Save detailed results
-    save_detailed_results(all_results, dataset_results, args.output)
+    save_detailed_results(all_results, overall_agg, per_dataset_agg, args.output,
+                          parquet=args.parquet, pretty=args.pretty)
 
 
 if __name__ == '__main__':
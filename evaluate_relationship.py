@@ -1,13 +1,63 @@
 import json
 import argparse
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Dict, List
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
 
-def load_relationship_validations(validation_dir: Path) -> Dict:
-    """Load relationship validation results from validation files."""
+
+def _parse_one(validation_file) -> tuple:
+    """Parse one validation file into (scene_id, total, pair counts).
+
+    Returns None when the file has no predicted relationships. The counts
+    compose associatively, so files can be parsed in any order (and in
+    parallel) and merged afterwards.
+    """
+    with open(validation_file, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Cheap byte scan before the full parse: files without a
+            # predicted block contribute nothing
+            if mm.find(b'"predicted"') == -1:
+                return None
+            data = orjson.loads(memoryview(mm)) if orjson is not None else json.loads(mm[:])
+        finally:
+            mm.close()
+
+    scene_id = data.get('scene_id', Path(validation_file).stem.replace('annotations_', ''))
+
+    if 'relationships' not in data or 'predicted' not in data['relationships']:
+        return None
+
+    relationships = data['relationships']['predicted']['items']
+
+    # Count (predicate, validation) pairs in one tight loop, then derive
+    # the per-scene and global stats from the counter in a single pass
+    counts = Counter(
+        (rel['predicate'], rel.get('validation')) for rel in relationships
+    )
+    return scene_id, len(relationships), counts
+
+
+def load_relationship_validations(validation_dir: Path,
+                                  cache_dir: Path = Path('data/.relationship_cache')) -> Dict:
+    """Load relationship validation results from validation files.
+
+    The aggregated result is cached as a pickle keyed by the (name, mtime)
+    list of the validation files, so re-runs over an unchanged directory skip
+    re-parsing thousands of small JSONs entirely.
+    """
     all_results = {
         'per_scene': {},
         'per_predicate': defaultdict(lambda: {'correct': 0, 'incorrect': 0}),
@@ -16,57 +66,88 @@ def load_relationship_validations(validation_dir: Path) -> Dict:
         'total_null_validation': 0,
         'total_relationships': 0
     }
-    
-    for validation_file in sorted(validation_dir.glob("annotations_*.json")):
-        with open(validation_file, 'r') as f:
-            data = json.load(f)
-        
-        scene_id = data.get('scene_id', validation_file.stem.replace('annotations_', ''))
-        
-        if 'relationships' not in data or 'predicted' not in data['relationships']:
+
+    files = sorted(validation_dir.glob("annotations_*.json"))
+
+    cache_path = None
+    if cache_dir is not None:
+        h = hashlib.blake2b(digest_size=16)
+        for p in files:
+            h.update(f"{p.name}\0{p.stat().st_mtime_ns}\n".encode())
+        cache_path = Path(cache_dir) / f"{h.hexdigest()}.pkl"
+        if cache_path.exists():
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+
+    # Parsing is JSON-bound and per-file independent; spread it over a
+    # process pool when there are enough files to amortize the startup cost
+    if len(files) > 4:
+        with ProcessPoolExecutor() as ex:
+            parsed = list(ex.map(_parse_one, files, chunksize=16))
+    else:
+        parsed = [_parse_one(f) for f in files]
+
+    for item in parsed:
+        if item is None:
             continue
-        
-        relationships = data['relationships']['predicted']['items']
-        
+        scene_id, total_rels, counts = item
+
         scene_stats = {
             'correct': 0,
             'incorrect': 0,
             'null_validation': 0,
-            'total': len(relationships),
+            'total': total_rels,
             'by_predicate': defaultdict(lambda: {'correct': 0, 'incorrect': 0})
         }
-        
-        for rel in relationships:
-            predicate = rel['predicate']
-            validation = rel.get('validation')
-            
+
+        per_predicate = all_results['per_predicate']
+        for (predicate, validation), n in counts.items():
+            # Intern the small predicate vocabulary so repeated dict lookups
+            # across scenes compare by pointer instead of by characters
+            predicate = sys.intern(predicate)
             if validation is None:
-                scene_stats['null_validation'] += 1
-                all_results['total_null_validation'] += 1
+                scene_stats['null_validation'] += n
+                all_results['total_null_validation'] += n
             elif validation == 'correct':
-                scene_stats['correct'] += 1
-                scene_stats['by_predicate'][predicate]['correct'] += 1
-                all_results['per_predicate'][predicate]['correct'] += 1
-                all_results['total_correct'] += 1
+                scene_stats['correct'] += n
+                scene_stats['by_predicate'][predicate]['correct'] += n
+                per_predicate[predicate]['correct'] += n
+                all_results['total_correct'] += n
             elif validation == 'incorrect':
-                scene_stats['incorrect'] += 1
-                scene_stats['by_predicate'][predicate]['incorrect'] += 1
-                all_results['per_predicate'][predicate]['incorrect'] += 1
-                all_results['total_incorrect'] += 1
-        
+                scene_stats['incorrect'] += n
+                scene_stats['by_predicate'][predicate]['incorrect'] += n
+                per_predicate[predicate]['incorrect'] += n
+                all_results['total_incorrect'] += n
+
         scene_stats['accuracy'] = scene_stats['correct'] / scene_stats['total'] if scene_stats['total'] > 0 else 0
         all_results['per_scene'][scene_id] = scene_stats
         all_results['total_relationships'] += scene_stats['total']
-    
+
+    # Collapse the defaultdicts to plain dicts so the result pickles; the
+    # callers only read from them
+    all_results['per_predicate'] = dict(all_results['per_predicate'])
+    for scene_stats in all_results['per_scene'].values():
+        scene_stats['by_predicate'] = dict(scene_stats['by_predicate'])
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump(all_results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+
     return all_results
 
 
 def print_results(results: Dict, output_file: Path = None):
     """Print and save relationship evaluation results."""
-    
-    print("="*80)
-    print("RELATIONSHIP PREDICTION EVALUATION")
-    print("="*80)
+
+    # Build all lines first and emit them with one write; per-line print()
+    # locks and may flush stdout on every call
+    out = []
+    out.append("="*80)
+    out.append("RELATIONSHIP PREDICTION EVALUATION")
+    out.append("="*80)
     
     total = results['total_relationships']
     correct = results['total_correct']
@@ -79,33 +160,33 @@ def print_results(results: Dict, output_file: Path = None):
     scene_accuracies = [scene['accuracy'] for scene in results['per_scene'].values()]
     avg_accuracy = np.mean(scene_accuracies) if scene_accuracies else 0
     
-    print(f"\nOVERALL STATISTICS (averaged across {len(scene_accuracies)} scenes):")
-    print(f"  Average Accuracy: {avg_accuracy:.3f} ({avg_accuracy*100:.1f}%)")
-    print(f"\nTotal counts (all scenes combined):")
-    print(f"  Total relationships: {total}")
-    print(f"  Evaluated: {evaluated_total} ({evaluated_total/total*100:.1f}%)")
-    print(f"  Not evaluated (null): {null_val} ({null_val/total*100:.1f}%)")
-    print(f"  Correct: {correct}")
-    print(f"  Incorrect: {incorrect}")
+    out.append(f"\nOVERALL STATISTICS (averaged across {len(scene_accuracies)} scenes):")
+    out.append(f"  Average Accuracy: {avg_accuracy:.3f} ({avg_accuracy*100:.1f}%)")
+    out.append(f"\nTotal counts (all scenes combined):")
+    out.append(f"  Total relationships: {total}")
+    out.append(f"  Evaluated: {evaluated_total} ({evaluated_total/total*100:.1f}%)")
+    out.append(f"  Not evaluated (null): {null_val} ({null_val/total*100:.1f}%)")
+    out.append(f"  Correct: {correct}")
+    out.append(f"  Incorrect: {incorrect}")
     
     # Per-scene results
-    print(f"\n{'='*80}")
-    print("PER-SCENE RESULTS:")
-    print(f"{'='*80}")
+    out.append(f"\n{'='*80}")
+    out.append("PER-SCENE RESULTS:")
+    out.append(f"{'='*80}")
     
     for scene_id in sorted(results['per_scene'].keys()):
         scene = results['per_scene'][scene_id]
-        print(f"\n{scene_id}:")
-        print(f"  Total: {scene['total']}")
-        print(f"  Correct: {scene['correct']}")
-        print(f"  Incorrect: {scene['incorrect']}")
-        print(f"  Null: {scene['null_validation']}")
-        print(f"  Accuracy: {scene['accuracy']:.3f} ({scene['accuracy']*100:.1f}%)")
+        out.append(f"\n{scene_id}:")
+        out.append(f"  Total: {scene['total']}")
+        out.append(f"  Correct: {scene['correct']}")
+        out.append(f"  Incorrect: {scene['incorrect']}")
+        out.append(f"  Null: {scene['null_validation']}")
+        out.append(f"  Accuracy: {scene['accuracy']:.3f} ({scene['accuracy']*100:.1f}%)")
     
     # Per-predicate results
-    print(f"\n{'='*80}")
-    print("PER-PREDICATE RESULTS:")
-    print(f"{'='*80}")
+    out.append(f"\n{'='*80}")
+    out.append("PER-PREDICATE RESULTS:")
+    out.append(f"{'='*80}")
     
     # Sort by total count
     predicate_stats = []
@@ -122,11 +203,11 @@ def print_results(results: Dict, output_file: Path = None):
     
     predicate_stats.sort(key=lambda x: x['total'], reverse=True)
     
-    print(f"\n{'Predicate':<30} {'Total':<8} {'Correct':<10} {'Incorrect':<10} {'Accuracy':<10}")
-    print("-" * 80)
+    out.append(f"\n{'Predicate':<30} {'Total':<8} {'Correct':<10} {'Incorrect':<10} {'Accuracy':<10}")
+    out.append("-" * 80)
     for stat in predicate_stats:
-        print(f"{stat['predicate']:<30} {stat['total']:<8} {stat['correct']:<10} "
-              f"{stat['incorrect']:<10} {stat['accuracy']:<10.3f}")
+        out.append(f"{stat['predicate']:<30} {stat['total']:<8} {stat['correct']:<10} "
+                   f"{stat['incorrect']:<10} {stat['accuracy']:<10.3f}")
     
     # Prepare output data
     output_data = {
@@ -164,10 +245,16 @@ def print_results(results: Dict, output_file: Path = None):
     
     # Save results
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(output_data, f, indent=2)
-        print(f"\n{'='*80}")
-        print(f"Results saved to {output_file}")
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(output_data, f, indent=2)
+        out.append(f"\n{'='*80}")
+        out.append(f"Results saved to {output_file}")
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
@@ -1,237 +1,421 @@
+from __future__ import annotations
+
 import json
 import argparse
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Tuple
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+try:
+    import numba
+except ImportError:  # optional; the numpy filter path is the fallback
+    numba = None
+
+
+def _load_json(path) -> Dict:
+    """Parse a JSON file, using orjson when available for faster decoding.
+
+    Larger files are memory-mapped so orjson decodes straight from the page
+    cache without an intermediate bytes copy; small files skip the mmap
+    setup cost and read normally.
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= 65536:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return orjson.loads(memoryview(mm))
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@lru_cache(maxsize=1024)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Dict:
+    """Parse-once cache keyed by path and mtime.
+
+    Within a run (e.g. --dataset both, or library callers hitting the same
+    files twice) repeated loads come from memory; a touched file changes its
+    mtime and re-parses.
+    """
+    return _load_json(path_str)
+
+
+def _encode_pairs(id1: np.ndarray, id2: np.ndarray) -> np.ndarray:
+    """Encode object-ID pairs order-independently as (min << 32) | max uint64s.
+
+    A single integer per pair lets the metric computation use sorted-array
+    merges (np.intersect1d) over contiguous memory instead of hashing tuples.
+    """
+    lo = np.minimum(id1, id2).astype(np.uint64)
+    hi = np.maximum(id1, id2).astype(np.uint64)
+    return (lo << np.uint64(32)) | hi
+
+
+def _load_one_validation(validation_file) -> Tuple[str, Dict]:
+    """Load one validation file into (scene_id, per-scene entry)."""
+    data = _load_json_cached(str(validation_file), os.stat(validation_file).st_mtime_ns)
+    scene_id = data['scene_id']
+
+    # Extract validated object IDs from attributes
+    validated_objects = np.empty(0, dtype=np.int64)
+    if 'attributes' in data and 'predicted' in data['attributes']:
+        items = data['attributes']['predicted']['items']
+        validated_objects = np.unique(np.fromiter(
+            (item['object_id'] for item in items),
+            dtype=np.int64, count=len(items)))
+
+    # Extract similarity annotations
+    similarity_annotations = data.get('similarity', {}).get('annotations', [])
+
+    # Encode as (min, max) to handle bidirectional pairs
+    similarity_pairs = np.empty(0, dtype=np.uint64)
+    if similarity_annotations:
+        id1 = np.fromiter((a['id1'] for a in similarity_annotations),
+                          dtype=np.int64, count=len(similarity_annotations))
+        id2 = np.fromiter((a['id2'] for a in similarity_annotations),
+                          dtype=np.int64, count=len(similarity_annotations))
+        similarity_pairs = np.unique(_encode_pairs(id1, id2))
+
+    return scene_id, {
+        'similarity_pairs': similarity_pairs,
+        'validated_objects': validated_objects,
+        'total_annotations': len(similarity_annotations)
+    }
+
 
 def load_validation_results(validation_dir: Path) -> Dict[str, Dict]:
-    """Load validation results and extract similarity annotations."""
-    validation_data = {}
-    
-    for validation_file in validation_dir.glob("annotations_*.json"):
-        with open(validation_file, 'r') as f:
-            data = json.load(f)
-            scene_id = data['scene_id']
-            
-            # Extract validated object IDs from attributes
-            validated_objects = set()
-            if 'attributes' in data and 'predicted' in data['attributes']:
-                for item in data['attributes']['predicted']['items']:
-                    validated_objects.add(item['object_id'])
-            
-            # Extract similarity annotations
-            similarity_annotations = data.get('similarity', {}).get('annotations', [])
-            
-            # Convert to set of tuples (min_id, max_id) to handle bidirectional pairs
-            similarity_pairs = set()
-            for annotation in similarity_annotations:
-                id1, id2 = annotation['id1'], annotation['id2']
-                # Store as (min, max) to ensure consistent representation
-                similarity_pairs.add((min(id1, id2), max(id1, id2)))
-            
-            validation_data[scene_id] = {
-                'similarity_pairs': similarity_pairs,
-                'validated_objects': validated_objects,
-                'total_annotations': len(similarity_annotations)
-            }
-    
-    return validation_data
+    """Load validation results and extract similarity annotations.
+
+    Similarity pairs come back as sorted unique uint64-encoded arrays and
+    validated objects as sorted unique int64 arrays. Files load in parallel;
+    each is independent and the time is dominated by read + parse.
+    """
+    # Sort once so reads hit the disk sequentially (glob order is
+    # filesystem-dependent and often effectively random)
+    paths = sorted(validation_dir.glob("annotations_*.json"))
 
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        return dict(ex.map(_load_one_validation, paths))
 
-def load_model_predictions(scenegraph_dir: Path, scene_ids: List[str], 
-                          validated_objects_per_scene: Dict[str, Set[int]]) -> Dict[str, Set[Tuple[int, int]]]:
+
+def _build_bitset(ids: np.ndarray) -> np.ndarray:
+    """Pack small non-negative integer IDs into a dense uint64 bitset."""
+    if ids.size == 0:
+        return np.zeros(1, dtype=np.uint64)
+    bits = np.zeros((int(ids.max()) >> 6) + 1, dtype=np.uint64)
+    np.bitwise_or.at(bits, ids >> 6, np.uint64(1) << (ids & 63).astype(np.uint64))
+    return bits
+
+
+def _bitset_contains(bitset: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Vectorized membership test: one shift+AND per ID against the bitset."""
+    word = ids >> 6
+    in_range = (ids >= 0) & (word < bitset.size)
+    out = np.zeros(ids.size, dtype=bool)
+    out[in_range] = (bitset[word[in_range]]
+                     >> (ids[in_range] & 63).astype(np.uint64)) & np.uint64(1) != 0
+    return out
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _filter_encode(obj_arr, related_arr, validated_bits):
+        """Fused bitset filter + pair encode over all edges in one C loop."""
+        out = np.empty(obj_arr.size, dtype=np.uint64)
+        n = 0
+        nwords = validated_bits.size
+        for i in range(obj_arr.size):
+            o = obj_arr[i]
+            r = related_arr[i]
+            if o < 0 or r < 0 or (o >> 6) >= nwords or (r >> 6) >= nwords:
+                continue
+            if ((validated_bits[o >> 6] >> np.uint64(o & 63)) & np.uint64(1)
+                    and (validated_bits[r >> 6] >> np.uint64(r & 63)) & np.uint64(1)):
+                lo, hi = (o, r) if o < r else (r, o)
+                out[n] = (np.uint64(lo) << np.uint64(32)) | np.uint64(hi)
+                n += 1
+        return out[:n]
+else:
+    _filter_encode = None
+
+
+def load_model_predictions(scenegraph_dir: Path, scene_ids: List[str],
+                          validated_objects_per_scene: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
     """Load model predictions from scenegraph attributes files for specific scenes.
-    
-    Only includes pairs where both objects were validated.
+
+    Only includes pairs where both objects were validated; returns sorted
+    unique uint64-encoded pair arrays per scene.
     """
     predictions = {}
-    
-    for scene_id in scene_ids:
-        scene_dir = scenegraph_dir / scene_id
-        
-        if not scene_dir.exists():
-            print(f"Warning: Scene directory not found for {scene_id}")
-            continue
-        
-        attributes_file = scene_dir / "attributes_from_images.json"
-        
-        if not attributes_file.exists():
-            print(f"Warning: Attributes file not found for {scene_id}")
-            continue
-        
-        with open(attributes_file, 'r') as f:
-            data = json.load(f)
-        
+
+    def _load_one(scene_id):
+        attributes_file = scenegraph_dir / scene_id / "attributes_from_images.json"
+
+        # EAFP on the success path; a missing file or directory surfaces as
+        # the same error from the stat
+        try:
+            data = _load_json_cached(str(attributes_file),
+                                     os.stat(attributes_file).st_mtime_ns)
+        except FileNotFoundError:
+            return scene_id, None, f"Warning: Attributes file not found for {scene_id}"
+
         # Get validated objects for this scene
-        validated_objects = validated_objects_per_scene.get(scene_id, set())
-        
-        # Extract similarity pairs from "related" field
-        # Only include pairs where BOTH objects were validated
-        predicted_pairs = set()
+        validated_objects = validated_objects_per_scene.get(scene_id)
+        if validated_objects is None:
+            validated_objects = np.empty(0, dtype=np.int64)
+
+        # Build the (obj, related) edge columns in bulk: parse the keys once,
+        # repeat each by its related-list length and flatten the lists with a
+        # single fromiter pass; only pairs where BOTH objects were validated
+        # survive the filter below
+        keys = np.fromiter(map(int, data.keys()), dtype=np.int64, count=len(data))
+        related_lists = [obj_data.get('related') or [] for obj_data in data.values()]
+        related_lens = np.fromiter(map(len, related_lists),
+                                   dtype=np.int64, count=len(related_lists))
+        total_edges = int(related_lens.sum())
+
         filtered_count = 0
-        for obj_id_str, obj_data in data.items():
-            obj_id = int(obj_id_str)
-            related = obj_data.get('related', [])
-            
-            # Handle None or empty related field
-            if related is None:
-                related = []
-            
-            for related_id in related:
-                # Only include if both objects are in the validated set
-                if obj_id in validated_objects and related_id in validated_objects:
-                    # Store as (min, max) to ensure consistent representation
-                    predicted_pairs.add((min(obj_id, related_id), max(obj_id, related_id)))
-                else:
-                    filtered_count += 1
-        
+        predicted_pairs = np.empty(0, dtype=np.uint64)
+        if total_edges:
+            # Object IDs are small, so a dense bitset answers membership with
+            # a shift+AND per edge endpoint instead of a sorted-array search
+            validated_bits = _build_bitset(validated_objects)
+            obj_arr = np.repeat(keys, related_lens)
+            related_arr = np.fromiter(
+                (rid for related in related_lists for rid in related),
+                dtype=np.int64, count=total_edges)
+            if _filter_encode is not None:
+                # Fused numba kernel: filter and encode without the boolean
+                # mask and gather intermediates
+                encoded = _filter_encode(obj_arr, related_arr, validated_bits)
+                filtered_count = total_edges - int(encoded.size)
+                predicted_pairs = np.unique(encoded)
+            else:
+                keep = (_bitset_contains(validated_bits, obj_arr)
+                        & _bitset_contains(validated_bits, related_arr))
+                filtered_count = int((~keep).sum())
+                predicted_pairs = np.unique(_encode_pairs(obj_arr[keep], related_arr[keep]))
+
+        message = None
         if filtered_count > 0:
-            print(f"  Scene {scene_id}: Filtered out {filtered_count} predictions involving non-validated objects")
-        
-        predictions[scene_id] = predicted_pairs
-    
+            message = (f"  Scene {scene_id}: Filtered out {filtered_count} "
+                       f"predictions involving non-validated objects")
+        return scene_id, predicted_pairs, message
+
+    # On cold cache, queue readahead for every file up front so the disk
+    # works ahead of the parse threads instead of one read at a time
+    if sys.platform == 'linux' and len(scene_ids) > 64 and hasattr(os, 'posix_fadvise'):
+        for scene_id in scene_ids:
+            try:
+                fd = os.open(scenegraph_dir / scene_id / "attributes_from_images.json",
+                             os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+
+    # Per-scene files are independent; load them in parallel and keep the
+    # printing on the caller's thread so warnings stay in scene order
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        for scene_id, predicted_pairs, message in ex.map(_load_one, scene_ids):
+            if message:
+                print(message)
+            if predicted_pairs is not None:
+                predictions[scene_id] = predicted_pairs
+
     return predictions
 
 
-def compute_metrics(ground_truth: Set[Tuple[int, int]], 
-                   predicted: Set[Tuple[int, int]]) -> Dict[str, float]:
-    """Compute precision, recall, and F1 score for similarity predictions."""
-    
-    if len(predicted) == 0:
-        precision = 0.0
-    else:
-        true_positives = len(ground_truth & predicted)
-        precision = true_positives / len(predicted)
-    
-    if len(ground_truth) == 0:
-        recall = 0.0
-    else:
-        true_positives = len(ground_truth & predicted)
-        recall = true_positives / len(ground_truth)
-    
+def compute_metrics(ground_truth: np.ndarray,
+                   predicted: np.ndarray) -> Dict[str, float]:
+    """Compute precision, recall, and F1 score for similarity predictions.
+
+    Both inputs are sorted unique uint64-encoded pair arrays, so the overlap
+    is a vectorized sorted-array merge rather than per-tuple hash probes.
+    """
+
+    # One intersection serves precision, recall and the returned counts
+    tp = int(np.intersect1d(ground_truth, predicted, assume_unique=True).size)
+    pred_n = int(predicted.size)
+    gt_n = int(ground_truth.size)
+
+    precision = tp / pred_n if pred_n else 0.0
+    recall = tp / gt_n if gt_n else 0.0
+
     if precision + recall == 0:
         f1 = 0.0
     else:
         f1 = 2 * (precision * recall) / (precision + recall)
-    
+
     return {
         'precision': precision,
         'recall': recall,
         'f1': f1,
-        'true_positives': len(ground_truth & predicted),
-        'false_positives': len(predicted - ground_truth),
-        'false_negatives': len(ground_truth - predicted),
-        'ground_truth_total': len(ground_truth),
-        'predicted_total': len(predicted)
+        'true_positives': tp,
+        'false_positives': pred_n - tp,
+        'false_negatives': gt_n - tp,
+        'ground_truth_total': gt_n,
+        'predicted_total': pred_n
     }
 
 
-def evaluate_similarity(validation_dir: Path, scenegraph_dir: Path, output_file: Path = None):
-    """Evaluate similarity predictions against ground truth annotations."""
-    
+def _evaluate_dataset(validation_dir: Path, scenegraph_dir: Path,
+                      verbose: bool = False) -> Tuple[Dict, List[Dict]]:
+    """Run the load/filter/score pipeline for one dataset directory pair.
+
+    Returns the per-scene metrics dict and the flat metrics list used for
+    aggregation; both are empty when validation and predictions share no
+    scenes. Per-scene breakdowns print only when verbose is set, one write
+    per scene.
+    """
     print("Loading validation results...")
     validation_data = load_validation_results(validation_dir)
     print(f"Loaded validation data for {len(validation_data)} scenes")
-    
+
     # Only load predictions for scenes that have validation data
     annotated_scene_ids = list(validation_data.keys())
     validated_objects_per_scene = {
-        scene_id: data['validated_objects'] 
+        scene_id: data['validated_objects']
         for scene_id, data in validation_data.items()
     }
-    
+
     print(f"\nLoading model predictions for {len(annotated_scene_ids)} annotated scenes...")
     print("(Only evaluating predictions where both objects were validated)")
     predictions = load_model_predictions(scenegraph_dir, annotated_scene_ids, validated_objects_per_scene)
     print(f"Loaded predictions for {len(predictions)} scenes")
-    
+
     # Find scenes with both validation and predictions
     common_scenes = set(validation_data.keys()) & set(predictions.keys())
     print(f"\nEvaluating {len(common_scenes)} scenes with both validation and predictions")
-    
+
     if not common_scenes:
         print("No common scenes found! Check scene IDs.")
         print(f"Validation scenes: {list(validation_data.keys())[:5]}")
         print(f"Prediction scenes: {list(predictions.keys())[:5]}")
-        return
-    
+        return {}, []
+
     # Evaluate each scene
     results = {}
     all_metrics = []
-    
+
     for scene_id in sorted(common_scenes):
         ground_truth = validation_data[scene_id]['similarity_pairs']
         predicted = predictions[scene_id]
         validated_objects = validation_data[scene_id]['validated_objects']
-        
+
         metrics = compute_metrics(ground_truth, predicted)
         results[scene_id] = metrics
         all_metrics.append(metrics)
-        
-        print(f"\n{scene_id}:")
-        print(f"  Validated objects: {len(validated_objects)}")
-        print(f"  Ground truth pairs: {metrics['ground_truth_total']}")
-        print(f"  Predicted pairs (filtered): {metrics['predicted_total']}")
-        print(f"  True positives: {metrics['true_positives']}")
-        print(f"  False positives: {metrics['false_positives']}")
-        print(f"  False negatives: {metrics['false_negatives']}")
-        print(f"  Precision: {metrics['precision']:.3f}")
-        print(f"  Recall: {metrics['recall']:.3f}")
-        print(f"  F1: {metrics['f1']:.3f}")
-    
-    # Compute aggregate metrics (per-scene average)
-    if all_metrics:
-        print("\n" + "="*80)
-        print("OVERALL METRICS (averaged across scenes):")
-        print("="*80)
-        
-        avg_precision = np.mean([m['precision'] for m in all_metrics])
-        avg_recall = np.mean([m['recall'] for m in all_metrics])
-        avg_f1 = np.mean([m['f1'] for m in all_metrics])
-        
-        total_tp = sum([m['true_positives'] for m in all_metrics])
-        total_fp = sum([m['false_positives'] for m in all_metrics])
-        total_fn = sum([m['false_negatives'] for m in all_metrics])
-        total_gt = sum([m['ground_truth_total'] for m in all_metrics])
-        total_pred = sum([m['predicted_total'] for m in all_metrics])
-        
-        print(f"\nAverage across {len(all_metrics)} scenes:")
-        print(f"  Precision: {avg_precision:.3f} ({avg_precision*100:.1f}%)")
-        print(f"  Recall: {avg_recall:.3f} ({avg_recall*100:.1f}%)")
-        print(f"  F1: {avg_f1:.3f}")
-        
-        print(f"\nTotal counts (all scenes combined):")
-        print(f"  Ground truth pairs: {total_gt}")
-        print(f"  Predicted pairs: {total_pred}")
-        print(f"  True positives: {total_tp}")
-        print(f"  False positives: {total_fp}")
-        print(f"  False negatives: {total_fn}")
-        
-        # Prepare output data
-        output_data = {
-            'per_scene_results': results,
-            'overall_metrics': {
-                'precision': float(avg_precision),
-                'recall': float(avg_recall),
-                'f1': float(avg_f1),
-                'num_scenes': len(all_metrics)
-            },
-            'total_counts': {
-                'ground_truth_pairs': total_gt,
-                'predicted_pairs': total_pred,
-                'true_positives': total_tp,
-                'false_positives': total_fp,
-                'false_negatives': total_fn
-            }
+
+        if verbose:
+            sys.stdout.write('\n'.join((
+                f"\n{scene_id}:",
+                f"  Validated objects: {len(validated_objects)}",
+                f"  Ground truth pairs: {metrics['ground_truth_total']}",
+                f"  Predicted pairs (filtered): {metrics['predicted_total']}",
+                f"  True positives: {metrics['true_positives']}",
+                f"  False positives: {metrics['false_positives']}",
+                f"  False negatives: {metrics['false_negatives']}",
+                f"  Precision: {metrics['precision']:.3f}",
+                f"  Recall: {metrics['recall']:.3f}",
+                f"  F1: {metrics['f1']:.3f}",
+            )) + '\n')
+
+    return results, all_metrics
+
+
+def _summarize(results: Dict, all_metrics: List[Dict]) -> Dict:
+    """Print the overall metrics block and build the output data structure."""
+    print("\n" + "="*80)
+    print("OVERALL METRICS (averaged across scenes):")
+    print("="*80)
+
+    # One structured-array pass over the metrics instead of eight separate
+    # list comprehensions
+    arr = np.fromiter(
+        ((m['precision'], m['recall'], m['f1'], m['true_positives'],
+          m['false_positives'], m['false_negatives'],
+          m['ground_truth_total'], m['predicted_total']) for m in all_metrics),
+        dtype=np.dtype([('prec', 'f8'), ('rec', 'f8'), ('f1', 'f8'),
+                        ('tp', 'i8'), ('fp', 'i8'), ('fn', 'i8'),
+                        ('gt', 'i8'), ('pred', 'i8')]),
+        count=len(all_metrics))
+
+    avg_precision = arr['prec'].mean()
+    avg_recall = arr['rec'].mean()
+    avg_f1 = arr['f1'].mean()
+
+    total_tp = int(arr['tp'].sum())
+    total_fp = int(arr['fp'].sum())
+    total_fn = int(arr['fn'].sum())
+    total_gt = int(arr['gt'].sum())
+    total_pred = int(arr['pred'].sum())
+
+    print(f"\nAverage across {len(all_metrics)} scenes:")
+    print(f"  Precision: {avg_precision:.3f} ({avg_precision*100:.1f}%)")
+    print(f"  Recall: {avg_recall:.3f} ({avg_recall*100:.1f}%)")
+    print(f"  F1: {avg_f1:.3f}")
+
+    print(f"\nTotal counts (all scenes combined):")
+    print(f"  Ground truth pairs: {total_gt}")
+    print(f"  Predicted pairs: {total_pred}")
+    print(f"  True positives: {total_tp}")
+    print(f"  False positives: {total_fp}")
+    print(f"  False negatives: {total_fn}")
+
+    return {
+        'per_scene_results': results,
+        'overall_metrics': {
+            'precision': float(avg_precision),
+            'recall': float(avg_recall),
+            'f1': float(avg_f1),
+            'num_scenes': len(all_metrics)
+        },
+        'total_counts': {
+            'ground_truth_pairs': total_gt,
+            'predicted_pairs': total_pred,
+            'true_positives': total_tp,
+            'false_positives': total_fp,
+            'false_negatives': total_fn
         }
-        
-        # Save results if output file specified
-        if output_file:
-            with open(output_file, 'w') as f:
+    }
+
+
+def _save_results(output_data: Dict, output_file: Path, pretty: bool = False):
+    # Compact by default: the results are machine-consumed and indentation
+    # multiplies both the bytes written and the downstream parse time
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=option))
+    else:
+        with open(output_file, 'w') as f:
+            if pretty:
                 json.dump(output_data, f, indent=2)
-            print(f"\nResults saved to {output_file}")
+            else:
+                json.dump(output_data, f, separators=(',', ':'))
+    print(f"\nResults saved to {output_file}")
+
+
+def evaluate_similarity(validation_dir: Path, scenegraph_dir: Path, output_file: Path = None,
+                        verbose: bool = False):
+    """Evaluate similarity predictions against ground truth annotations."""
+    results, all_metrics = _evaluate_dataset(validation_dir, scenegraph_dir, verbose=verbose)
+
+    if all_metrics:
+        output_data = _summarize(results, all_metrics)
+        if output_file:
+            _save_results(output_data, output_file)
 
 
 def main():
@@ -249,7 +433,11 @@ def main():
     parser.add_argument('--output', type=str,
                        default='similarity_eval_results.json',
                        help='Output file for evaluation results')
-    
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print the per-scene metric breakdown')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent the output JSON (larger file, easier to eyeball)')
+
     args = parser.parse_args()
     
     validation_base = Path(args.validation_dir)
@@ -284,100 +472,17 @@ def main():
         print(f"EVALUATING {dataset.upper()}")
         print(f"{'='*80}")
         
-        # Load and evaluate this dataset
-        validation_data = load_validation_results(validation_dir)
-        print(f"Loaded validation data for {len(validation_data)} scenes")
-        
-        annotated_scene_ids = list(validation_data.keys())
-        validated_objects_per_scene = {
-            scene_id: data['validated_objects'] 
-            for scene_id, data in validation_data.items()
-        }
-        
-        print(f"\nLoading model predictions for {len(annotated_scene_ids)} annotated scenes...")
-        print("(Only evaluating predictions where both objects were validated)")
-        predictions = load_model_predictions(scenegraph_dir, annotated_scene_ids, validated_objects_per_scene)
-        print(f"Loaded predictions for {len(predictions)} scenes")
-        
-        common_scenes = set(validation_data.keys()) & set(predictions.keys())
-        print(f"\nEvaluating {len(common_scenes)} scenes with both validation and predictions")
-        
-        if not common_scenes:
-            print("No common scenes found! Skipping dataset.")
-            continue
-        
-        # Evaluate each scene
-        for scene_id in sorted(common_scenes):
-            ground_truth = validation_data[scene_id]['similarity_pairs']
-            predicted = predictions[scene_id]
-            validated_objects = validation_data[scene_id]['validated_objects']
-            
-            metrics = compute_metrics(ground_truth, predicted)
-            all_results[f"{dataset}/{scene_id}"] = metrics
-            all_metrics.append(metrics)
-            
-            print(f"\n{scene_id}:")
-            print(f"  Validated objects: {len(validated_objects)}")
-            print(f"  Ground truth pairs: {metrics['ground_truth_total']}")
-            print(f"  Predicted pairs (filtered): {metrics['predicted_total']}")
-            print(f"  True positives: {metrics['true_positives']}")
-            print(f"  False positives: {metrics['false_positives']}")
-            print(f"  False negatives: {metrics['false_negatives']}")
-            print(f"  Precision: {metrics['precision']:.3f}")
-            print(f"  Recall: {metrics['recall']:.3f}")
-            print(f"  F1: {metrics['f1']:.3f}")
+        results, metrics = _evaluate_dataset(validation_dir, scenegraph_dir,
+                                             verbose=args.verbose)
+        for scene_id, scene_metrics in results.items():
+            all_results[f"{dataset}/{scene_id}"] = scene_metrics
+        all_metrics.extend(metrics)
     
     # Compute overall metrics
     if all_metrics:
-        print("\n" + "="*80)
-        print("OVERALL METRICS (averaged across all scenes):")
-        print("="*80)
-        
-        avg_precision = np.mean([m['precision'] for m in all_metrics])
-        avg_recall = np.mean([m['recall'] for m in all_metrics])
-        avg_f1 = np.mean([m['f1'] for m in all_metrics])
-        
-        total_tp = sum([m['true_positives'] for m in all_metrics])
-        total_fp = sum([m['false_positives'] for m in all_metrics])
-        total_fn = sum([m['false_negatives'] for m in all_metrics])
-        total_gt = sum([m['ground_truth_total'] for m in all_metrics])
-        total_pred = sum([m['predicted_total'] for m in all_metrics])
-        
-        print(f"\nAverage across {len(all_metrics)} scenes:")
-        print(f"  Precision: {avg_precision:.3f} ({avg_precision*100:.1f}%)")
-        print(f"  Recall: {avg_recall:.3f} ({avg_recall*100:.1f}%)")
-        print(f"  F1: {avg_f1:.3f}")
-        
-        print(f"\nTotal counts (all scenes combined):")
-        print(f"  Ground truth pairs: {total_gt}")
-        print(f"  Predicted pairs: {total_pred}")
-        print(f"  True positives: {total_tp}")
-        print(f"  False positives: {total_fp}")
-        print(f"  False negatives: {total_fn}")
-        
-        # Prepare output data
-        output_data = {
-            'per_scene_results': all_results,
-            'overall_metrics': {
-                'precision': float(avg_precision),
-                'recall': float(avg_recall),
-                'f1': float(avg_f1),
-                'num_scenes': len(all_metrics)
-            },
-            'total_counts': {
-                'ground_truth_pairs': total_gt,
-                'predicted_pairs': total_pred,
-                'true_positives': total_tp,
-                'false_positives': total_fp,
-                'false_negatives': total_fn
-            }
-        }
-        
-        # Save results
+        output_data = _summarize(all_results, all_metrics)
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(output_data, f, indent=2)
-            print(f"\nResults saved to {output_file}")
+            _save_results(output_data, output_file, pretty=args.pretty)
 
 
 if __name__ == '__main__':
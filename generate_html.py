@@ -7,6 +7,11 @@ import os
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def list_available_scenes(scenegraph_base="data/scenegraphs/scannet"):
     """
@@ -18,17 +23,16 @@ def list_available_scenes(scenegraph_base="data/scenegraphs/scannet"):
     Returns:
         List of scene IDs (e.g., ['scene0000_00', 'scene0001_00', ...])
     """
-    base_path = Path(scenegraph_base)
-    if not base_path.exists():
+    # os.scandir caches the entry type from the directory read, so this is
+    # one readdir plus one stat per candidate instead of two stats per entry
+    try:
+        with os.scandir(scenegraph_base) as it:
+            scenes = [entry.name for entry in it
+                      if entry.is_dir(follow_symlinks=False)
+                      and os.path.isfile(os.path.join(entry.path, "scene_graph.json"))]
+    except FileNotFoundError:
         return []
-    
-    scenes = []
-    for scene_dir in sorted(base_path.iterdir()):
-        if scene_dir.is_dir():
-            scene_graph_file = scene_dir / "scene_graph.json"
-            if scene_graph_file.exists():
-                scenes.append(scene_dir.name)
-    
+    scenes.sort()
     return scenes
 
 
@@ -43,18 +47,15 @@ def list_multiscan_scenes(multiscan_base="data/multiscan"):
         List of scene IDs (e.g., ['scene_00000_00', 'scene_00001_00', ...])
     """
     # Look for scenes in the scenegraphs directory (has proper relationships & attributes)
-    scenegraph_path = Path("data/scenegraphs/multiscan")
-    if not scenegraph_path.exists():
+    try:
+        with os.scandir("data/scenegraphs/multiscan") as it:
+            scenes = [entry.name for entry in it
+                      if entry.name.startswith('scene_')
+                      and entry.is_dir(follow_symlinks=False)
+                      and os.path.isfile(os.path.join(entry.path, "scene_graph.json"))]
+    except FileNotFoundError:
         return []
-    
-    scenes = []
-    for scene_dir in sorted(scenegraph_path.iterdir()):
-        if scene_dir.is_dir() and scene_dir.name.startswith('scene_'):
-            # Check for scene_graph.json file
-            scene_graph_file = scene_dir / "scene_graph.json"
-            if scene_graph_file.exists():
-                scenes.append(scene_dir.name)
-    
+    scenes.sort()
     return scenes
 
 
@@ -69,20 +70,15 @@ def list_3rscan_scenes(rscan_base="data/3rscan/download"):
         List of scene IDs (UUIDs like '02b33dfb-be2b-2d54-92d2-cd012b2b3c40')
     """
     # Look for scenes in the scenegraphs directory
-    scenegraph_path = Path("data/scenegraphs/3rscan")
-    if not scenegraph_path.exists():
+    # (3RScan scene IDs are UUIDs in 8-4-4-4-12 hex format)
+    try:
+        with os.scandir("data/scenegraphs/3rscan") as it:
+            scenes = [entry.name for entry in it
+                      if entry.is_dir(follow_symlinks=False)
+                      and os.path.isfile(os.path.join(entry.path, "scene_graph.json"))]
+    except FileNotFoundError:
         return []
-    
-    scenes = []
-    for scene_dir in sorted(scenegraph_path.iterdir()):
-        if scene_dir.is_dir():
-            # 3RScan scene IDs are UUIDs (8-4-4-4-12 hex format)
-            scene_id = scene_dir.name
-            # Check for scene_graph.json file
-            scene_graph_file = scene_dir / "scene_graph.json"
-            if scene_graph_file.exists():
-                scenes.append(scene_id)
-    
+    scenes.sort()
     return scenes
 
 
@@ -1304,7 +1300,71 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
     <script>
         // PLY file parser - handles both ASCII and binary
+        //
+        // Large binary PLYs are decoded in a dedicated Web Worker so the
+        // render loop and scene selector stay responsive. The worker is
+        // built from the parser functions themselves via toString() into a
+        // Blob URL (no separate file needed), and the ArrayBuffer in and the
+        // typed arrays out are passed as transferables - zero-copy both ways.
+        let plyWorker = null;
+        let plyWorkerBusy = false;
+
+        function getPLYWorker() {
+            if (plyWorker !== null) return plyWorker;
+            try {
+                const workerBody = [
+                    sRGBToLinear.toString(),
+                    parseASCIIPLY.toString(),
+                    parseBinaryPLY.toString(),
+                    parsePLYInline.toString(),
+                    'self.onmessage = async function(e) {',
+                    '    try {',
+                    '        const result = await parsePLYInline(e.data);',
+                    '        const transfers = [];',
+                    '        if (result.points && result.points.buffer) transfers.push(result.points.buffer);',
+                    '        if (result.colors && result.colors.buffer && (!result.points.buffer || result.colors.buffer !== result.points.buffer)) transfers.push(result.colors.buffer);',
+                    '        if (result.indices && result.indices.buffer) transfers.push(result.indices.buffer);',
+                    '        self.postMessage(result, transfers);',
+                    '    } catch (err) {',
+                    '        self.postMessage({ error: String((err && err.message) || err) });',
+                    '    }',
+                    '};'
+                ].join('\\n');
+                plyWorker = new Worker(URL.createObjectURL(new Blob([workerBody], { type: 'application/javascript' })));
+            } catch (err) {
+                console.warn('Could not create PLY worker, decoding on main thread:', err);
+                plyWorker = false;
+            }
+            return plyWorker;
+        }
+
         async function parsePLY(data) {
+            // Worth a worker round-trip only for sizable binary buffers;
+            // strings and small files decode inline
+            if (data instanceof ArrayBuffer && data.byteLength > 1048576 &&
+                typeof Worker !== 'undefined' && !plyWorkerBusy) {
+                const worker = getPLYWorker();
+                if (worker) {
+                    plyWorkerBusy = true;
+                    try {
+                        return await new Promise((resolve, reject) => {
+                            worker.onmessage = (e) => {
+                                if (e.data && e.data.error) reject(new Error(e.data.error));
+                                else resolve(e.data);
+                            };
+                            worker.onerror = (e) => reject(new Error(e.message || 'PLY worker error'));
+                            // Transfer ownership of the buffer - no copy
+                            worker.postMessage(data, [data]);
+                        });
+                    } finally {
+                        plyWorkerBusy = false;
+                    }
+                }
+            }
+            return parsePLYInline(data);
+        }
+
+        async function parsePLYInline(data) {
             let text, arrayBuffer;
             if (data instanceof ArrayBuffer) {
                 arrayBuffer = data;
@@ -1471,113 +1531,217 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         }
         
         function parseASCIIPLY(text, headerEnd, vertexCount, faceCount, hasColors) {
-            const lines = text.split('\\n');
-            const points = [];
-            const colors = [];
-            const indices = [];
-            
+            // Single forward scan over the string with charCodeAt - avoids
+            // split('\\n') materializing one string per line plus a regex
+            // split and trim per vertex
+            const end = text.length;
+            let p = text.indexOf('end_header');
+            if (p >= 0) {
+                p = text.indexOf('\\n', p) + 1;
+            } else {
+                p = 0;
+            }
+
+            const points = new Float32Array(vertexCount * 3);
+            const colors = hasColors ? new Float32Array(vertexCount * 3) : null;
+            let indices = new Uint32Array(faceCount * 3);
+
+            // Advance past whitespace (including blank lines), then past the
+            // token, and parse the substring; bound keeps reads on this line
+            function readNumber(bound) {
+                while (p < bound) {
+                    const c = text.charCodeAt(p);
+                    if (c === 32 || c === 9 || c === 13) p++;
+                    else break;
+                }
+                if (p >= bound) return NaN;
+                const start = p;
+                while (p < bound) {
+                    const c = text.charCodeAt(p);
+                    if (c === 32 || c === 9 || c === 10 || c === 13) break;
+                    p++;
+                }
+                return parseFloat(text.substring(start, p));
+            }
+
             // Parse vertices
-            const dataLines = lines.slice(headerEnd, headerEnd + vertexCount);
-            dataLines.forEach(line => {
-                if (!line.trim()) return;
-                const parts = line.trim().split(/\\s+/);
-                if (parts.length >= 3) {
-                    let x = parseFloat(parts[0]);
-                    let y = parseFloat(parts[1]);
-                    let z = parseFloat(parts[2]);
-                    // Replace NaN or invalid values with 0
-                    if (isNaN(x) || !isFinite(x)) x = 0;
-                    if (isNaN(y) || !isFinite(y)) y = 0;
-                    if (isNaN(z) || !isFinite(z)) z = 0;
-                    points.push(x, y, z);
-                    
-                    if (hasColors && parts.length >= 6) {
+            let vertsRead = 0;
+            let colorsFound = false;
+            for (let i = 0; i < vertexCount && p < end; i++) {
+                // Skip any leading blank lines, then bound reads to this line
+                while (p < end) {
+                    const c = text.charCodeAt(p);
+                    if (c === 10 || c === 13 || c === 32 || c === 9) p++;
+                    else break;
+                }
+                if (p >= end) break;
+                let nl = text.indexOf('\\n', p);
+                if (nl === -1) nl = end;
+
+                let x = readNumber(nl);
+                let y = readNumber(nl);
+                let z = readNumber(nl);
+                // Replace NaN or invalid values with 0
+                if (!Number.isFinite(x)) x = 0;
+                if (!Number.isFinite(y)) y = 0;
+                if (!Number.isFinite(z)) z = 0;
+                points[i * 3] = x;
+                points[i * 3 + 1] = y;
+                points[i * 3 + 2] = z;
+
+                if (hasColors) {
+                    const r = readNumber(nl);
+                    const g = readNumber(nl);
+                    const b = readNumber(nl);
+                    if (Number.isFinite(r) && Number.isFinite(g) && Number.isFinite(b)) {
                         // Convert from sRGB to linear space for correct rendering
-                        const r = parseInt(parts[3]) / 255;
-                        const g = parseInt(parts[4]) / 255;
-                        const b = parseInt(parts[5]) / 255;
-                        colors.push(
-                            sRGBToLinear(r),
-                            sRGBToLinear(g),
-                            sRGBToLinear(b)
-                        );
+                        colors[i * 3] = sRGBToLinear(r / 255);
+                        colors[i * 3 + 1] = sRGBToLinear(g / 255);
+                        colors[i * 3 + 2] = sRGBToLinear(b / 255);
+                        colorsFound = true;
                     }
                 }
-            });
-            
+
+                p = nl + 1;
+                vertsRead++;
+            }
+
             // Parse faces
+            let usedCount = 0;
             if (faceCount > 0) {
-                const faceStart = headerEnd + vertexCount;
-                const faceLines = lines.slice(faceStart, faceStart + faceCount);
-                const maxVertex = (points.length / 3) - 1;
-                faceLines.forEach(line => {
-                    if (!line.trim()) return;
-                    const parts = line.trim().split(/\\s+/);
-                    const numVerts = parseInt(parts[0]);
-                    if (numVerts === 3 && parts.length >= 4) {
+                const maxVertex = vertsRead - 1;
+                for (let i = 0; i < faceCount && p < end; i++) {
+                    while (p < end) {
+                        const c = text.charCodeAt(p);
+                        if (c === 10 || c === 13 || c === 32 || c === 9) p++;
+                        else break;
+                    }
+                    if (p >= end) break;
+                    let nl = text.indexOf('\\n', p);
+                    if (nl === -1) nl = end;
+
+                    const numVerts = readNumber(nl);
+                    if (numVerts === 3) {
                         // Triangle - validate indices
-                        const v0 = parseInt(parts[1]);
-                        const v1 = parseInt(parts[2]);
-                        const v2 = parseInt(parts[3]);
+                        const v0 = readNumber(nl);
+                        const v1 = readNumber(nl);
+                        const v2 = readNumber(nl);
                         if (v0 >= 0 && v0 <= maxVertex && v1 >= 0 && v1 <= maxVertex && v2 >= 0 && v2 <= maxVertex) {
-                            indices.push(v0, v1, v2);
+                            const out = usedCount * 3;
+                            indices[out] = v0;
+                            indices[out + 1] = v1;
+                            indices[out + 2] = v2;
+                            usedCount++;
                         }
                     }
-                });
+                    p = nl + 1;
+                }
             }
-            
-            return { points, colors, indices, hasColors: hasColors && colors.length > 0, hasFaces: faceCount > 0 };
+            indices = indices.subarray(0, usedCount * 3);
+
+            return {
+                points: vertsRead === vertexCount ? points : points.subarray(0, vertsRead * 3),
+                colors: colorsFound ? colors : [],
+                indices,
+                hasColors: hasColors && colorsFound,
+                hasFaces: faceCount > 0
+            };
         }
         
         function parseBinaryPLY(arrayBuffer, headerLength, vertexCount, faceCount, hasColors, bytesPerVertex, colorOffset, xOffset, yOffset, zOffset, xyzIsDouble, faceExtraBytes = 0) {
             console.log('Parsing binary PLY: headerLength=', headerLength, 'vertexCount=', vertexCount, 'faceCount=', faceCount, 'hasColors=', hasColors, 'bytesPerVertex=', bytesPerVertex, 'colorOffset=', colorOffset, 'xyzOffsets=', xOffset, yOffset, zOffset, 'xyzIsDouble=', xyzIsDouble, 'faceExtraBytes=', faceExtraBytes);
             const view = new DataView(arrayBuffer, headerLength);
-            const points = [];
             const colors = [];
-            const indices = [];
             let offset = 0;
-            
+
             console.log('Total binary data size:', view.byteLength, 'Expected vertex data size:', vertexCount * bytesPerVertex);
-            
+
             try {
-                // Parse all vertices
-                for (let i = 0; i < vertexCount; i++) {
-                    if (offset + bytesPerVertex > view.byteLength) {
-                        console.warn('Reached end of buffer at vertex', i);
-                        break;
-                    }
-                    
-                    // Read x, y, z from their actual positions (as double or float)
-                    let x, y, z;
-                    if (xyzIsDouble) {
-                        x = view.getFloat64(offset + xOffset, true);
-                        y = view.getFloat64(offset + yOffset, true);
-                        z = view.getFloat64(offset + zOffset, true);
-                    } else {
-                        x = view.getFloat32(offset + xOffset, true);
-                        y = view.getFloat32(offset + yOffset, true);
-                        z = view.getFloat32(offset + zOffset, true);
+                // Number of complete vertices actually present in the buffer
+                const availVerts = Math.min(vertexCount, Math.floor(view.byteLength / bytesPerVertex));
+                if (availVerts < vertexCount) {
+                    console.warn('Buffer only holds', availVerts, 'of', vertexCount, 'vertices');
+                }
+
+                // Preallocate positions up front instead of growing a dynamic
+                // Array with push() - avoids reallocation and GC churn on
+                // multi-million vertex meshes
+                let points = new Float32Array(vertexCount * 3);
+
+                if (!xyzIsDouble && bytesPerVertex === 12 && xOffset === 0 && yOffset === 4 && zOffset === 8) {
+                    // Fast path: vertices are nothing but little-endian float32
+                    // x/y/z, so the whole block is a single aligned copy
+                    points.set(new Float32Array(arrayBuffer.slice(headerLength, headerLength + availVerts * 12)));
+                } else if (!xyzIsDouble && headerLength % 4 === 0 && bytesPerVertex % 4 === 0 &&
+                           xOffset % 4 === 0 && yOffset % 4 === 0 && zOffset % 4 === 0) {
+                    // Aligned stride path: index a Float32Array view directly
+                    // instead of paying a DataView call per coordinate
+                    const f32 = new Float32Array(arrayBuffer, headerLength, Math.floor((arrayBuffer.byteLength - headerLength) / 4));
+                    const u8 = new Uint8Array(arrayBuffer, headerLength);
+                    const stride = bytesPerVertex / 4;
+                    const x4 = xOffset / 4, y4 = yOffset / 4, z4 = zOffset / 4;
+                    const readColors = hasColors && colorOffset >= 0;
+                    for (let i = 0; i < availVerts; i++) {
+                        const base = i * stride;
+                        points[i * 3] = f32[base + x4];
+                        points[i * 3 + 1] = f32[base + y4];
+                        points[i * 3 + 2] = f32[base + z4];
+                        if (readColors) {
+                            const c = i * bytesPerVertex + colorOffset;
+                            // Skip alpha at colorOffset + 3
+                            // Convert from sRGB to linear space for correct rendering
+                            colors.push(sRGBToLinear(u8[c] / 255), sRGBToLinear(u8[c + 1] / 255), sRGBToLinear(u8[c + 2] / 255));
+                        }
                     }
-                    
-                    // Replace NaN with 0 (will be excluded from bounding box calculation)
-                    if (isNaN(x) || !isFinite(x)) x = 0;
-                    if (isNaN(y) || !isFinite(y)) y = 0;
-                    if (isNaN(z) || !isFinite(z)) z = 0;
-                    
-                    points.push(x, y, z);
-                    
-                    if (hasColors && colorOffset >= 0 && offset + colorOffset + 4 <= view.byteLength) {
-                        const r = view.getUint8(offset + colorOffset) / 255;
-                        const g = view.getUint8(offset + colorOffset + 1) / 255;
-                        const b = view.getUint8(offset + colorOffset + 2) / 255;
-                        // Skip alpha at colorOffset + 3
-                        // Convert from sRGB to linear space for correct rendering
-                        colors.push(sRGBToLinear(r), sRGBToLinear(g), sRGBToLinear(b));
+                } else {
+                    // General path: per-vertex DataView reads (doubles, unaligned
+                    // header, odd strides)
+                    for (let i = 0; i < availVerts; i++) {
+                        const base = i * bytesPerVertex;
+                        if (xyzIsDouble) {
+                            points[i * 3] = view.getFloat64(base + xOffset, true);
+                            points[i * 3 + 1] = view.getFloat64(base + yOffset, true);
+                            points[i * 3 + 2] = view.getFloat64(base + zOffset, true);
+                        } else {
+                            points[i * 3] = view.getFloat32(base + xOffset, true);
+                            points[i * 3 + 1] = view.getFloat32(base + yOffset, true);
+                            points[i * 3 + 2] = view.getFloat32(base + zOffset, true);
+                        }
+                        if (hasColors && colorOffset >= 0 && base + colorOffset + 4 <= view.byteLength) {
+                            const r = view.getUint8(base + colorOffset) / 255;
+                            const g = view.getUint8(base + colorOffset + 1) / 255;
+                            const b = view.getUint8(base + colorOffset + 2) / 255;
+                            // Skip alpha at colorOffset + 3
+                            // Convert from sRGB to linear space for correct rendering
+                            colors.push(sRGBToLinear(r), sRGBToLinear(g), sRGBToLinear(b));
+                        }
                     }
-                    
-                    offset += bytesPerVertex;
                 }
-                
+
+                if (availVerts < vertexCount) {
+                    points = points.subarray(0, availVerts * 3);
+                }
+                offset = availVerts * bytesPerVertex;
+
+                // Scrub NaN/Infinity with one bit test per float: every
+                // NaN/Inf encoding has all exponent bits set, so aliasing the
+                // buffer as uint32 replaces two function calls per value with
+                // a single mask compare (all-zero bits is +0.0). These
+                // vertices are excluded from bounding box calculation.
+                const u32 = new Uint32Array(points.buffer, points.byteOffset, points.length);
+                for (let i = 0; i < u32.length; i++) {
+                    if ((u32[i] & 0x7F800000) === 0x7F800000) u32[i] = 0;
+                }
+
+                // Flag origin vertices (almost always scrubbed NaNs) once, so
+                // the face filter below reads one byte per vertex instead of
+                // re-fetching three floats at random indices per corner
+                const originMask = new Uint8Array(points.length / 3);
+                for (let i = 0; i < originMask.length; i++) {
+                    const j = i * 3;
+                    if (points[j] === 0 && points[j + 1] === 0 && points[j + 2] === 0) originMask[i] = 1;
+                }
+
                 const actualVertexCount = points.length / 3;
                 console.log('Parsed', actualVertexCount, 'vertices from binary PLY');
                 console.log('Offset after vertices:', offset, '/', view.byteLength, 'bytes');
@@ -1604,37 +1768,65 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 console.log('Coordinate check: valid=' + validCount + ', invalid=' + invalidCount);
                 if (sampleInvalid.length > 0) console.log('Sample invalid vertices:', sampleInvalid);
                 
-                // Parse faces
+                // Parse faces into a pre-sized Uint32Array; only the first
+                // usedCount*3 entries are valid and returned via subarray
+                let indices = new Uint32Array(faceCount * 3);
+                let usedCount = 0;
                 if (faceCount > 0) {
                     let invalidFaceCount = 0;
                     let facesProcessed = 0;
+                    const maxVertex = actualVertexCount - 1;
+                    if (faceExtraBytes === 0 && view.byteLength - offset === faceCount * 13 && view.getUint8(offset) === 3) {
+                        // Fast path: uniform triangles at a fixed 13-byte stride
+                        // (uchar count + 3 int32), the ScanNet/3RScan layout -
+                        // stride straight through without re-reading the count
+                        for (let i = 0, o = offset; i < faceCount; i++, o += 13) {
+                            const v0 = view.getInt32(o + 1, true);
+                            const v1 = view.getInt32(o + 5, true);
+                            const v2 = view.getInt32(o + 9, true);
+                            if (v0 >= 0 && v0 <= maxVertex && v1 >= 0 && v1 <= maxVertex && v2 >= 0 && v2 <= maxVertex) {
+                                // Skip triangles touching an origin vertex (likely a replaced NaN)
+                                if ((originMask[v0] | originMask[v1] | originMask[v2]) === 0) {
+                                    const out = usedCount * 3;
+                                    indices[out] = v0;
+                                    indices[out + 1] = v1;
+                                    indices[out + 2] = v2;
+                                    usedCount++;
+                                } else {
+                                    invalidFaceCount++;
+                                }
+                            } else {
+                                invalidFaceCount++;
+                            }
+                        }
+                        facesProcessed = faceCount;
+                        offset += faceCount * 13;
+                    } else {
                     for (let i = 0; i < faceCount; i++) {
                         facesProcessed++;
                         if (offset + 1 > view.byteLength) {
                             console.warn('Ran out of buffer at face', i, 'offset:', offset, 'byteLength:', view.byteLength);
                             break;
                         }
-                        
+
                         // Read number of vertices in face (uchar)
                         const numVerts = view.getUint8(offset);
                         offset += 1;
-                        
+
                         if (numVerts === 3 && offset + 12 + faceExtraBytes <= view.byteLength) {
                             // Triangle - read 3 vertex indices as int32 (little endian)
                             const v0 = view.getInt32(offset, true);
                             const v1 = view.getInt32(offset + 4, true);
                             const v2 = view.getInt32(offset + 8, true);
-                            const maxVertex = actualVertexCount - 1;
                             // Only add valid indices within vertex range
                             if (v0 >= 0 && v0 <= maxVertex && v1 >= 0 && v1 <= maxVertex && v2 >= 0 && v2 <= maxVertex) {
-                                // Check if any vertex is at origin (likely a replaced NaN)
-                                const v0IsOrigin = points[v0*3] === 0 && points[v0*3+1] === 0 && points[v0*3+2] === 0;
-                                const v1IsOrigin = points[v1*3] === 0 && points[v1*3+1] === 0 && points[v1*3+2] === 0;
-                                const v2IsOrigin = points[v2*3] === 0 && points[v2*3+1] === 0 && points[v2*3+2] === 0;
-                                
-                                // Skip triangles with vertices at origin
-                                if (!v0IsOrigin && !v1IsOrigin && !v2IsOrigin) {
-                                    indices.push(v0, v1, v2);
+                                // Skip triangles touching an origin vertex (likely a replaced NaN)
+                                if ((originMask[v0] | originMask[v1] | originMask[v2]) === 0) {
+                                    const out = usedCount * 3;
+                                    indices[out] = v0;
+                                    indices[out + 1] = v1;
+                                    indices[out + 2] = v2;
+                                    usedCount++;
                                 } else {
                                     invalidFaceCount++;
                                 }
@@ -1656,9 +1848,11 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                             }
                         }
                     }
-                    console.log('Parsed', indices.length / 3, 'valid faces from binary PLY');
+                    }
+                    console.log('Parsed', usedCount, 'valid faces from binary PLY');
                     console.log('Processed', facesProcessed, '/', faceCount, 'faces, skipped', invalidFaceCount, 'invalid');
                 }
+                indices = indices.subarray(0, usedCount * 3);
                 
                 return { points, colors, indices, hasColors: hasColors && colors.length > 0, hasFaces: faceCount > 0 };
             } catch (error) {
@@ -2190,10 +2384,82 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             console.log('Textured mesh added to scene from', candidate.obj);
         }
 
+        // Parsed-PLY LRU cache: scene content is immutable for the session,
+        // so re-selecting a scene should not pay the fetch + decode again.
+        // Map preserves insertion order, so the first key is always the
+        // least recently used; the cap keeps at most a few large scenes
+        // resident (each can be ~100 MB of typed arrays).
+        const parsedPLYCache = new Map();
+        const PARSED_PLY_CACHE_MAX = 3;
+
+        function cacheGetParsedPLY(key) {
+            const entry = parsedPLYCache.get(key);
+            if (entry !== undefined) {
+                // Re-insert to refresh recency
+                parsedPLYCache.delete(key);
+                parsedPLYCache.set(key, entry);
+            }
+            return entry;
+        }
+
+        function cachePutParsedPLY(key, pcData) {
+            if (parsedPLYCache.has(key)) parsedPLYCache.delete(key);
+            parsedPLYCache.set(key, pcData);
+            while (parsedPLYCache.size > PARSED_PLY_CACHE_MAX) {
+                // Evict oldest; deleting the reference lets GC reclaim the buffers
+                parsedPLYCache.delete(parsedPLYCache.keys().next().value);
+            }
+        }
+
+        // Stream a PLY download into one preallocated buffer sized from
+        // Content-Length instead of response.arrayBuffer() - avoids the
+        // browser staging the body a second time on 100+ MB meshes and
+        // lets the loading overlay show download progress
+        async function fetchPLYBuffer(url) {
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+            const length = parseInt(response.headers.get('Content-Length') || '0', 10);
+            if (!response.body || !length || response.headers.get('Content-Encoding')) {
+                // No stream support, unknown size, or compressed transfer
+                // (Content-Length would be the compressed size) - one-shot read
+                return response.arrayBuffer();
+            }
+            let buffer = new Uint8Array(length);
+            const reader = response.body.getReader();
+            let received = 0;
+            const loadingEl = document.getElementById('loading');
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                if (received + value.length > buffer.length) {
+                    // Body larger than advertised - grow and keep going
+                    const grown = new Uint8Array(Math.max(buffer.length * 2, received + value.length));
+                    grown.set(buffer.subarray(0, received));
+                    buffer = grown;
+                }
+                buffer.set(value, received);
+                received += value.length;
+                if (loadingEl) {
+                    loadingEl.textContent = 'Loading... ' + Math.min(100, Math.round(received / length * 100)) + '%';
+                }
+            }
+            if (loadingEl) loadingEl.textContent = 'Loading...';
+            return received === buffer.length ? buffer.buffer : buffer.buffer.slice(0, received);
+        }
+
         async function loadPointCloudFile(file) {
             document.getElementById('loading').classList.remove('hidden');
-            
+
             try {
+                const cacheKey = 'file:' + file.name + ':' + file.size + ':' + file.lastModified;
+                const cached = cacheGetParsedPLY(cacheKey);
+                if (cached) {
+                    console.log('Using cached parsed PLY for', file.name);
+                    loadPointCloud(cached);
+                    return;
+                }
                 const arrayBuffer = await file.arrayBuffer();
                 const pcData = await parsePLY(arrayBuffer);
                 
@@ -2219,7 +2485,8 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                         console.log('Sampled to', sampledPoints.length / 3, 'points');
                     }
                 }
-                
+
+                cachePutParsedPLY(cacheKey, pcData);
                 loadPointCloud(pcData);
             } finally {
                 document.getElementById('loading').classList.add('hidden');
@@ -2241,41 +2508,57 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 return;
             }
 
-            // Validate positions - check for NaN and replace with 0
-            for (let i = 0; i < points.length; i++) {
-                if (isNaN(points[i]) || !isFinite(points[i])) {
-                    points[i] = 0;
+            // Wrap typed arrays directly - Float32BufferAttribute would make
+            // another full copy even when handed a Float32Array
+            const float32Attr = (array, itemSize) => array instanceof Float32Array
+                ? new THREE.BufferAttribute(array, itemSize)
+                : new THREE.Float32BufferAttribute(array, itemSize);
+
+            // Typed parser output is already NaN-scrubbed; only plain arrays
+            // (e.g. from the point-sampling path) still need validation
+            if (!(points instanceof Float32Array)) {
+                for (let i = 0; i < points.length; i++) {
+                    if (isNaN(points[i]) || !isFinite(points[i])) {
+                        points[i] = 0;
+                    }
                 }
             }
-            
+
             const geometry = new THREE.BufferGeometry();
-            geometry.setAttribute('position', new THREE.Float32BufferAttribute(points, 3));
+            geometry.setAttribute('position', float32Attr(points, 3));
 
             let material;
             
             // Use mesh if faces are available, otherwise use points
             if (data.hasFaces && data.indices && data.indices.length > 0) {
                 console.log('Rendering as mesh with', data.indices.length / 3, 'faces');
-                // Validate indices are within vertex range
-                const maxIndex = (points.length / 3) - 1;
-                const validIndices = [];
-                for (let i = 0; i < data.indices.length; i++) {
-                    const idx = data.indices[i];
-                    if (idx >= 0 && idx <= maxIndex) {
-                        validIndices.push(idx);
-                    }
-                }
-                if (validIndices.length > 0) {
-                    geometry.setIndex(validIndices);
+                if (data.indices instanceof Uint32Array) {
+                    // The parsers range-check every index before writing it
+                    // into the typed array - wrap it without re-filtering
+                    geometry.setIndex(new THREE.BufferAttribute(data.indices, 1));
                     geometry.computeVertexNormals();
                 } else {
-                    console.warn('No valid face indices found, rendering as point cloud instead');
-                    data.hasFaces = false;
+                    // Validate indices are within vertex range
+                    const maxIndex = (points.length / 3) - 1;
+                    const validIndices = [];
+                    for (let i = 0; i < data.indices.length; i++) {
+                        const idx = data.indices[i];
+                        if (idx >= 0 && idx <= maxIndex) {
+                            validIndices.push(idx);
+                        }
+                    }
+                    if (validIndices.length > 0) {
+                        geometry.setIndex(validIndices);
+                        geometry.computeVertexNormals();
+                    } else {
+                        console.warn('No valid face indices found, rendering as point cloud instead');
+                        data.hasFaces = false;
+                    }
                 }
                 
                 if (data.hasColors && data.colors && data.colors.length > 0) {
                     console.log('Using colored mesh, color count:', data.colors.length);
-                    geometry.setAttribute('color', new THREE.Float32BufferAttribute(data.colors, 3));
+                    geometry.setAttribute('color', float32Attr(data.colors, 3));
                     material = new THREE.MeshBasicMaterial({ 
                         vertexColors: true,
                         side: THREE.DoubleSide
@@ -2308,7 +2591,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 if (data.hasColors && data.colors && data.colors.length > 0) {
                     console.log('Using colored point cloud, color count:', data.colors.length);
                     // Colors are already in 0-1 range from PLY parser
-                    geometry.setAttribute('color', new THREE.Float32BufferAttribute(data.colors, 3));
+                    geometry.setAttribute('color', float32Attr(data.colors, 3));
                     material = new THREE.PointsMaterial({ 
                         size: pointSize, 
                         vertexColors: true,
@@ -3941,18 +4224,23 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
                 // Load point cloud - try various naming patterns if mesh was not loaded
                 let plyLoaded = meshLoaded;
-                
+
                 if (!meshLoaded) {
+                    // Re-selected scene: reuse the parsed typed arrays instead
+                    // of fetching and decoding the PLY again
+                    const cached = cacheGetParsedPLY(sceneId);
+                    if (cached) {
+                        console.log('Using cached parsed PLY for', sceneId);
+                        loadPointCloud(cached);
+                        plyLoaded = true;
+                    }
+                }
+
+                if (!plyLoaded) {
                     for (const plyUrl of plyUrls) {
                         try {
                             console.log('Attempting to fetch:', plyUrl);
-                            const plyResponse = await fetch(plyUrl);
-                            console.log('Fetch response status:', plyResponse.status, plyResponse.statusText);
-                            if (!plyResponse.ok) {
-                                throw new Error(`HTTP ${plyResponse.status}: ${plyResponse.statusText}`);
-                            }
-                            console.log('Loading PLY from:', plyUrl);
-                            const plyArrayBuffer = await plyResponse.arrayBuffer();
+                            const plyArrayBuffer = await fetchPLYBuffer(plyUrl);
                             console.log('PLY file loaded, size:', plyArrayBuffer.byteLength, 'bytes');
                             const pcData = await parsePLY(plyArrayBuffer);
                             console.log('Parsed PLY - points:', pcData.points.length / 3, 'hasColors:', pcData.hasColors);
@@ -4014,6 +4302,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                                 }
                             }
                             
+                        cachePutParsedPLY(sceneId, pcData);
                         loadPointCloud(pcData);
                         plyLoaded = true;
                         console.log('Point cloud loaded successfully from:', plyUrl);
@@ -4047,14 +4336,31 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 """
 
 
-def generate_html(output_path="viewer.html", scene_graph_url=None, ply_url=None, 
+# Split the template once at import time around its two injection points
+# (the scene-list script and the optional auto-load script). Each run then
+# assembles the HTML with a single bytes.join of pre-encoded segments
+# instead of str.replace rescanning the whole template per marker.
+_SCENES_MARKER = '        // Detect dataset from scene ID pattern\n        function getDatasetFromSceneId'
+_INIT_MARKER = '        // Initialize\n        initViewer();'
+_head, _rest = HTML_TEMPLATE.split(_SCENES_MARKER, 1)
+_mid, _tail = _rest.split(_INIT_MARKER, 1)
+_TEMPLATE_PARTS = (
+    _head.encode('utf-8'),
+    (_SCENES_MARKER + _mid).encode('utf-8'),
+    (_INIT_MARKER + _tail).encode('utf-8'),
+)
+del _head, _rest, _mid, _tail
+
+
+def generate_html(output_path="viewer.html", scene_graph_url=None, ply_url=None,
                   scenegraph_base="data/scenegraphs/scannet",
                   multiscan_base="data/multiscan",
                   rscan_base="data/3rscan/download",
                   refresh_predicates=False,
                   max_scannet_scenes=None,
                   max_multiscan_scenes=None,
-                  max_rscan_scenes=None):
+                  max_rscan_scenes=None,
+                  gzip_output=False):
     """
     Generate the standalone HTML viewer file with ScanNet, MultiScan, and 3RScan datasets.
     
@@ -4068,6 +4374,7 @@ def generate_html(output_path="viewer.html", scene_graph_url=None, ply_url=None,
         max_scannet_scenes: Optional limit on number of ScanNet scenes to include
         max_multiscan_scenes: Optional limit on number of MultiScan scenes to include
         max_rscan_scenes: Optional limit on number of 3RScan scenes to include
+        gzip_output: If True, also write a precompressed <output>.gz sibling
     """
     output_path = Path(output_path)
     
@@ -4091,24 +4398,17 @@ def generate_html(output_path="viewer.html", scene_graph_url=None, ply_url=None,
     all_predicates = collect_all_predicates(force_refresh=refresh_predicates)
     print(f"Found {len(all_predicates)} unique predicates")
     
-    # Modify template
-    template = HTML_TEMPLATE
-    
-    # Embed scene list and predicates as JavaScript
-    scenes_json = json.dumps(all_scenes)
-    predicates_json = json.dumps(all_predicates)
-    scenes_script = f'\n        availableScenes = {scenes_json};\n        allPredicates = {predicates_json};\n'
-    
-    # Insert scene list after global variables declaration  
-    global_vars_marker = '        // Detect dataset from scene ID pattern\n        function getDatasetFromSceneId'
-    if global_vars_marker in template:
-        template = template.replace(global_vars_marker, 
-                                   scenes_script + global_vars_marker)
+    # Embed scene list and predicates as JavaScript (orjson encodes the
+    # dynamic chunks several times faster than stdlib json when available)
+    if orjson is not None:
+        scenes_json = orjson.dumps(all_scenes).decode('utf-8')
+        predicates_json = orjson.dumps(all_predicates).decode('utf-8')
     else:
-        # Fallback: insert before Initialize Three.js comment
-        template = template.replace('        // Initialize Three.js', 
-                                   scenes_script + '        // Initialize Three.js')
-    
+        scenes_json = json.dumps(all_scenes)
+        predicates_json = json.dumps(all_predicates)
+    scenes_script = f'\n        availableScenes = {scenes_json};\n        allPredicates = {predicates_json};\n'
+
+    auto_load_script = ''
     if scene_graph_url or ply_url:
         # Add auto-load functionality
         auto_load_script = """
@@ -4135,8 +4435,7 @@ def generate_html(output_path="viewer.html", scene_graph_url=None, ply_url=None,
             
             if (plyUrl) {
                 try {
-                    const response = await fetch(plyUrl);
-                    const arrayBuffer = await response.arrayBuffer();
+                    const arrayBuffer = await fetchPLYBuffer(plyUrl);
                     const pcData = await parsePLY(arrayBuffer);
                     
                     // Sample if too many points (only if no faces, as sampling would break face indices)
@@ -4172,18 +4471,33 @@ def generate_html(output_path="viewer.html", scene_graph_url=None, ply_url=None,
             }
         })();
 """
-        
-        # Insert before initViewer() call - find the exact marker with actual newline
-        init_marker = '        // Initialize\n        initViewer();'
-        if init_marker in template:
-            template = template.replace(init_marker, auto_load_script + init_marker)
-        else:
-            # Fallback: insert before closing script tag
-            template = template.replace('    </script>', auto_load_script + '    </script>')
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(template)
-    
+
+    # Assemble from the pre-split byte segments: the scene-list script goes
+    # in front of the first marker, the auto-load script (if any) in front
+    # of the initViewer() call. bytes.join is a single memcpy pass.
+    html_bytes = b"".join((
+        _TEMPLATE_PARTS[0],
+        scenes_script.encode('utf-8'),
+        _TEMPLATE_PARTS[1],
+        auto_load_script.encode('utf-8'),
+        _TEMPLATE_PARTS[2],
+    ))
+
+    with open(output_path, 'wb') as f:
+        f.write(html_bytes)
+
+    if gzip_output:
+        # The viewer is 100+ KB of highly redundant markup/JS; compressing
+        # once here lets a static file server (nginx gzip_static, CDNs)
+        # answer with Content-Encoding: gzip at ~5-8x fewer wire bytes
+        # without per-request compression. mtime=0 keeps the output
+        # deterministic across runs.
+        import gzip
+        gz_path = output_path.with_suffix(output_path.suffix + '.gz')
+        with open(gz_path, 'wb') as f:
+            f.write(gzip.compress(html_bytes, compresslevel=9, mtime=0))
+        print(f"Generated precompressed viewer: {gz_path.absolute()}")
+
     print(f"Generated HTML viewer: {output_path.absolute()}")
     print(f"Found {len(scannet_scenes)} ScanNet scenes, {len(multiscan_scenes)} MultiScan scenes, {len(rscan_scenes)} 3RScan scenes ({len(all_scenes)} total)")
     if scene_graph_url or ply_url:
@@ -4247,7 +4561,12 @@ if __name__ == "__main__":
         type=int,
         help="Maximum number of 3RScan scenes to include"
     )
-    
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Also write a gzip-precompressed <output>.gz for servers that serve static precompressed files"
+    )
+
     args = parser.parse_args()
     generate_html(args.output, args.scene_graph_url, args.ply_url, 
                   multiscan_base=args.multiscan_base,
@@ -4255,4 +4574,5 @@ if __name__ == "__main__":
                   refresh_predicates=args.refresh_predicates,
                   max_scannet_scenes=args.max_scannet_scenes,
                   max_multiscan_scenes=args.max_multiscan_scenes,
-                  max_rscan_scenes=args.max_rscan_scenes)
+                  max_rscan_scenes=args.max_rscan_scenes,
+                  gzip_output=args.gzip)